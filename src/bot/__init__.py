@@ -4,17 +4,46 @@ Bot package initialization and application factory.
 Creates and configures the Telegram bot application.
 """
 
+from typing import Any, Callable, Coroutine, Dict
+
+from telegram import Update
+from telegram.request import HTTPXRequest
 from telegram.ext import (
+    AIORateLimiter,
     Application,
-    CommandHandler,
+    ContextTypes,
+    PicklePersistence,
     MessageHandler,
     CallbackQueryHandler,
     filters
 )
 
 from src.config import config
+from src.constants import CallbackData
 from src.database import init_db
 
+# Only these update types are handled; everything else is filtered server-side
+ALLOWED_UPDATES = ["message", "callback_query"]
+
+# Updates processed at the same time; slow handlers no longer block the rest.
+# Handlers keep the default block=True: every handler lives in group 0, so
+# block=False would add no concurrency across updates, and it would make
+# ConversationHandler state changes (e.g. /set_meeting) lag behind replies.
+CONCURRENT_UPDATES = 64
+
+# Outgoing Bot API connections; sized for broadcast fan-out over HTTP/2
+HTTP_POOL_SIZE = 64
+
+# Outgoing Bot API calls are paced below Telegram's ~30 messages/second
+# global limit; a 429 is retried after the delay Telegram asks for.
+API_RATE_PER_SECOND = 30
+API_MAX_RETRIES = 2
+
+# Long-poll timeout in seconds (Telegram caps getUpdates at 50s; 30s is the usual choice)
+POLLING_TIMEOUT = 30
+
+CommandCallback = Callable[[Update, ContextTypes.DEFAULT_TYPE], Coroutine[Any, Any, Any]]
+
 
 def create_application() -> Application:
     """
@@ -31,15 +60,34 @@ def create_application() -> Application:
     
     Usage:
         >>> app = create_application()
-        >>> app.run_polling()
+        >>> run(app)
     """
     # Initialize database
     init_db(config.database.url)
     
     # Create application
+    builder = Application.builder()
+    if config.bot.use_persistence:
+        # Keeps conversation state and user_data across restarts
+        builder = builder.persistence(PicklePersistence(filepath=config.bot.persistence_file))
+    
     application = (
-        Application.builder()
+        builder
         .token(config.bot.token)
+        .request(HTTPXRequest(
+            connection_pool_size=HTTP_POOL_SIZE,
+            pool_timeout=5.0,
+            connect_timeout=5.0,
+            read_timeout=20.0,
+            http_version="2",
+        ))
+        .get_updates_request(HTTPXRequest(http_version="2"))
+        .rate_limiter(AIORateLimiter(
+            overall_max_rate=API_RATE_PER_SECOND,
+            overall_time_period=1,
+            max_retries=API_MAX_RETRIES,
+        ))
+        .concurrent_updates(CONCURRENT_UPDATES)
         .build()
     )
     
@@ -52,6 +100,36 @@ def create_application() -> Application:
     return application
 
 
+def run(application: Application) -> None:
+    """
+    Start receiving updates, via webhook or long polling per config.bot.mode.
+    
+    Webhook mode pushes updates to the bot as they arrive. Polling mode
+    keeps one long-poll request open at a time with no pause between them,
+    which suits local development. Either way, Telegram still limits
+    outgoing messages to about 30/second per bot.
+    
+    Args:
+        application: Application built by create_application()
+    """
+    if config.bot.use_webhook:
+        application.run_webhook(
+            listen=config.bot.webhook_listen,
+            port=config.bot.webhook_port,
+            webhook_url=config.bot.webhook_url,
+            secret_token=config.bot.webhook_secret,
+            allowed_updates=ALLOWED_UPDATES,
+            drop_pending_updates=True,
+        )
+    else:
+        application.run_polling(
+            poll_interval=0.0,
+            timeout=POLLING_TIMEOUT,
+            allowed_updates=ALLOWED_UPDATES,
+            drop_pending_updates=True,
+        )
+
+
 def _register_handlers(app: Application) -> None:
     """
     Register all message and command handlers.
@@ -94,7 +172,12 @@ def _register_handlers(app: Application) -> None:
         set_meeting_handler,
     )
     from src.bot.handlers.evidence import evidence_conversation
-    from src.bot.handlers.help import help_command, ngocminh_command, ngocminh_callback_handler
+    from src.bot.handlers.help import (
+        LEGACY_NGOCMINH_CALLBACKS,
+        help_command,
+        ngocminh_command,
+        ngocminh_callback_handler,
+    )
     from src.bot.handlers.menu import text_message_handler
     
     # =========================================================================
@@ -117,37 +200,37 @@ def _register_handlers(app: Application) -> None:
     app.add_handler(set_meeting_handler)
     
     # =========================================================================
-    # COMMAND HANDLERS - User commands
+    # COMMAND HANDLERS (single dispatcher over a name -> handler table)
     # =========================================================================
     
-    app.add_handler(CommandHandler("checkout", checkout_command))
-    app.add_handler(CommandHandler("status", status_command))
-    app.add_handler(CommandHandler("help", help_command))
-    app.add_handler(CommandHandler("ngocminh", ngocminh_command))
-    
-    # =========================================================================
-    # COMMAND HANDLERS - Admin commands
-    # =========================================================================
-    
-    app.add_handler(CommandHandler("approve", approve_command))
-    app.add_handler(CommandHandler("reject", reject_command))
-    app.add_handler(CommandHandler("ban", ban_command))
-    app.add_handler(CommandHandler("unban", unban_command))
-    app.add_handler(CommandHandler("list_users", list_users_command))
-    app.add_handler(CommandHandler("list_pending", list_pending_command))
-    app.add_handler(CommandHandler("list_locations", list_locations_command))
-    app.add_handler(CommandHandler("list_location", list_locations_command))  # Alias without 's'
-    app.add_handler(CommandHandler("delete_location", delete_location_command))
-    app.add_handler(CommandHandler("delete_meeting", delete_meeting_command))
-    app.add_handler(CommandHandler("today", today_command))
-    app.add_handler(CommandHandler("export", export_command))
-    app.add_handler(CommandHandler("export_excel", export_command))
-    app.add_handler(CommandHandler("exports", export_command))  # Common typo/alias
-    app.add_handler(CommandHandler("stats", stats_command))
-    app.add_handler(CommandHandler("broadcast", broadcast_command))
-    app.add_handler(CommandHandler("help_admin", help_admin_command))
-    app.add_handler(CommandHandler("list_meetings", list_meetings_command))
-    app.add_handler(CommandHandler("ranking", ranking_command))
+    commands: Dict[str, CommandCallback] = {
+        # User commands
+        "checkout": checkout_command,
+        "status": status_command,
+        "help": help_command,
+        "ngocminh": ngocminh_command,
+        # Admin commands
+        "approve": approve_command,
+        "reject": reject_command,
+        "ban": ban_command,
+        "unban": unban_command,
+        "list_users": list_users_command,
+        "list_pending": list_pending_command,
+        "list_locations": list_locations_command,
+        "list_location": list_locations_command,  # Alias without 's'
+        "delete_location": delete_location_command,
+        "delete_meeting": delete_meeting_command,
+        "today": today_command,
+        "export": export_command,
+        "export_excel": export_command,
+        "exports": export_command,  # Common typo/alias
+        "stats": stats_command,
+        "broadcast": broadcast_command,
+        "help_admin": help_admin_command,
+        "list_meetings": list_meetings_command,
+        "ranking": ranking_command,
+    }
+    app.add_handler(MessageHandler(filters.COMMAND, _make_command_dispatcher(commands)))
     
     # =========================================================================
     # MESSAGE HANDLERS
@@ -163,11 +246,80 @@ def _register_handlers(app: Application) -> None:
     # CALLBACK QUERY HANDLERS
     # =========================================================================
     
-    # Ngocminh callback (must be before generic admin handler)
-    app.add_handler(CallbackQueryHandler(ngocminh_callback_handler, pattern="^ngocminh_"))
+    # Single dispatcher keyed by the "prefix" part of "prefix:payload" data;
+    # anything unrouted falls through to the admin handler
+    callback_routes: Dict[str, CommandCallback] = {
+        CallbackData.NGOCMINH: ngocminh_callback_handler,
+        CallbackData.APPROVE_USER: admin_callback_handler,
+        CallbackData.REJECT_USER: admin_callback_handler,
+        CallbackData.APPROVE_EVIDENCE: admin_callback_handler,
+        CallbackData.REJECT_EVIDENCE: admin_callback_handler,
+        CallbackData.CANCEL: admin_callback_handler,
+        CallbackData.LIST_MEETINGS_PAGE: admin_callback_handler,
+    }
+    # Keyboards sent before the prefix format still carry the old data
+    callback_routes.update(
+        dict.fromkeys(LEGACY_NGOCMINH_CALLBACKS, ngocminh_callback_handler)
+    )
+    app.add_handler(CallbackQueryHandler(
+        _make_callback_dispatcher(callback_routes, admin_callback_handler)
+    ))
+
+
+def _make_command_dispatcher(
+    commands: Dict[str, CommandCallback],
+) -> CommandCallback:
+    """
+    Build a handler that routes /commands through a dict lookup.
+    
+    Mirrors CommandHandler behaviour: sets context.args and ignores
+    commands addressed to another bot via /command@botname.
+    
+    Args:
+        commands: Mapping of lowercase command name to handler
+        
+    Returns:
+        Async callback for a MessageHandler(filters.COMMAND)
+    """
+    async def dispatch(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        message = update.message
+        if not message or not message.text:
+            return
+        
+        parts = message.text.split()
+        command, _, bot_name = parts[0][1:].partition("@")
+        if bot_name and bot_name.lower() != (context.bot.username or "").lower():
+            return
+        
+        handler = commands.get(command.lower())
+        if handler is None:
+            return
+        
+        context.args = parts[1:]
+        await handler(update, context)
+    
+    return dispatch
+
+
+def _make_callback_dispatcher(
+    routes: Dict[str, CommandCallback],
+    default: CommandCallback,
+) -> CommandCallback:
+    """
+    Build a handler that routes callback queries by their data prefix.
+    
+    Args:
+        routes: Mapping of callback data prefix to handler
+        default: Handler for prefixes without a route
+        
+    Returns:
+        Async callback for a CallbackQueryHandler
+    """
+    async def dispatch(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        prefix = (update.callback_query.data or "").split(":", 1)[0]
+        await routes.get(prefix, default)(update, context)
     
-    # Admin callback handler (generic - handles all other callbacks)
-    app.add_handler(CallbackQueryHandler(admin_callback_handler))
+    return dispatch
 
 
 def _register_error_handler(app: Application) -> None:
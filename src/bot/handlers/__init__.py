@@ -4,66 +4,72 @@ Bot handlers package.
 Exports all handler functions for registration.
 """
 
-# Start/Registration handlers
-from .start import (
-    start_command,
-    registration_conversation,
-    WAITING_FOR_NAME,
-)
+import importlib
+from typing import Any, Dict, Tuple
 
-# Check-in/Check-out handlers
-from .checkin import (
-    checkin_conversation,
-    checkout_command,
-    status_command,
-    cancel_action,
-    CHECKIN_WAITING_FOR_LOCATION,
-)
+# Public name -> (submodule, attribute). Submodules are imported on first
+# access, so importing one handler module doesn't load all the others.
+_LAZY_EXPORTS: Dict[str, Tuple[str, str]] = {
+    # Start/Registration handlers
+    "start_command": ("start", "start_command"),
+    "registration_conversation": ("start", "registration_conversation"),
+    "WAITING_FOR_NAME": ("start", "WAITING_FOR_NAME"),
+    # Check-in/Check-out handlers
+    "checkin_conversation": ("checkin", "checkin_conversation"),
+    "CHECKIN_WAITING_FOR_LOCATION": ("checkin", "CHECKIN_WAITING_FOR_LOCATION"),
+    "checkout_command": ("checkin", "checkout_command"),
+    "status_command": ("checkin", "status_command"),
+    "cancel_action": ("checkin", "cancel_action"),
+    # Menu handler
+    "text_message_handler": ("menu", "text_message_handler"),
+    # Admin handlers
+    "approve_command": ("admin", "approve_command"),
+    "reject_command": ("admin", "reject_command"),
+    "ban_command": ("admin", "ban_command"),
+    "unban_command": ("admin", "unban_command"),
+    "list_users_command": ("admin", "list_users_command"),
+    "list_pending_command": ("admin", "list_pending_command"),
+    "broadcast_command": ("admin", "broadcast_command"),
+    "today_command": ("admin", "today_command"),
+    "export_command": ("admin", "export_command"),
+    "stats_command": ("admin", "stats_command"),
+    "help_admin_command": ("admin", "help_admin_command"),
+    "admin_callback_handler": ("admin", "admin_callback_handler"),
+    "list_locations_command": ("admin", "list_locations_command"),
+    "delete_location_command": ("admin", "delete_location_command"),
+    "list_meetings_command": ("admin", "list_meetings_command"),
+    "ranking_command": ("admin", "ranking_command"),
+    # Location handlers
+    "set_location_command": ("location", "set_location_command"),
+    "location_setup_conversation": ("location", "location_setup_conversation"),
+    "WAITING_FOR_LOCATION": ("location", "WAITING_FOR_LOCATION"),
+    "LOCATION_WAITING_FOR_NAME": ("location", "WAITING_FOR_NAME"),
+    "WAITING_FOR_RADIUS": ("location", "WAITING_FOR_RADIUS"),
+    # Evidence handlers
+    "evidence_conversation": ("evidence", "evidence_conversation"),
+    "minhchung_command": ("evidence", "minhchung_command"),
+    "WAITING_FOR_PHOTO": ("evidence", "WAITING_FOR_PHOTO"),
+    # Help handler
+    "help_command": ("help", "help_command"),
+    # Error handler
+    "error_handler": ("error", "error_handler"),
+}
 
-# Menu handler
-from .menu import text_message_handler
 
-# Admin handlers
-from .admin import (
-    approve_command,
-    reject_command,
-    ban_command,
-    unban_command,
-    list_users_command,
-    list_pending_command,
-    broadcast_command,
-    today_command,
-    export_command,
-    stats_command,
-    help_admin_command,
-    admin_callback_handler,
-    list_locations_command,
-    delete_location_command,
-    list_meetings_command,
-    ranking_command,
-)
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines name on first access (PEP 562)."""
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
 
-# Location handlers
-from .location import (
-    set_location_command,
-    location_setup_conversation,
-    WAITING_FOR_LOCATION,
-    WAITING_FOR_NAME as LOCATION_WAITING_FOR_NAME,
-    WAITING_FOR_RADIUS,
-)
 
-# Evidence handlers
-from .evidence import (
-    evidence_conversation,
-    minhchung_command,
-    WAITING_FOR_PHOTO,
-)
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# Help handler
-from .help import help_command
-
-# Error handler
-from .error import error_handler
 
 __all__ = [
     # Start
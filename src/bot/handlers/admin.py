@@ -11,11 +11,18 @@ Consolidates all administrative functions:
 - Broadcasting
 """
 
+import asyncio
 import logging
-from datetime import datetime
-from typing import Optional
-
-from telegram import Update, CallbackQuery
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from telegram import Update, CallbackQuery, InlineKeyboardMarkup, Message
 from telegram.ext import (
     ContextTypes,
     ConversationHandler,
@@ -25,22 +32,181 @@ from telegram.ext import (
     filters,
 )
 from telegram.constants import ParseMode
-from telegram.error import BadRequest
+from telegram.error import BadRequest, Forbidden, RetryAfter
 
-from src.services.user_service import UserService
+from src.services.attendance import AttendanceService
+from src.services.user_service import UserRow, UserService
 from src.services.geolocation import GeolocationService
 from src.services.export import ExportService
 from src.services.meeting_service import MeetingService
 from src.services.point_service import PointService
 from src.services.evidence_service import EvidenceService
-from src.database import User, UserStatus, UserRole, MeetingType, MEETING_POINTS
-from src.constants import Messages, CallbackData
+from src.database import Location, User, UserStatus, UserRole, MeetingType, MEETING_POINTS
+from src.constants import Messages, CallbackData, KeyboardLabels
 from src.bot.keyboards import Keyboards
-from src.bot.middlewares import require_admin, require_registration, log_action
+from src.bot.middlewares import admin_action, concurrency_limit
 from src.config import config
 
 logger = logging.getLogger(__name__)
 
+# Reply-keyboard buttons send their label verbatim, so exact-text filters suffice
+_CANCEL_FILTER = filters.Text([KeyboardLabels.CANCEL])
+
+# Broadcast fan-out limits (sender workers); the send rate itself is paced
+# by the application's rate limiter (see src.bot.API_RATE_PER_SECOND)
+BROADCAST_MAX_IN_FLIGHT = 25
+BROADCAST_PROGRESS_EVERY = 100
+BROADCAST_FAILURE_SAMPLE = 10
+
+# Background broadcasts / exports allowed to run at the same time (each)
+HEAVY_COMMAND_CONCURRENCY = 2
+
+# Excel exports and report queries run on worker threads so they don't block the event loop
+EXPORT_TIMEOUT_SECONDS = 120
+_export_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="export")
+
+# /list_meetings meetings per page
+MEETINGS_PAGE_SIZE = 10
+
+# /ranking shows this many users
+RANKING_TOP_N = 20
+
+# /list_pending users per message
+PENDING_PAGE_SIZE = 20
+
+# /list_users rendering (Telegram rejects messages over 4096 characters)
+MESSAGE_CHUNK_LIMIT = 3800
+_USER_SECTION_TITLES = {
+    UserStatus.ACTIVE: "Dang hoat dong",
+    UserStatus.PENDING: "Cho duyet",
+    UserStatus.BANNED: "Da cam",
+}
+_USER_LINE = "  - {name}{role}\n    ID: {user_id}"
+_ROLE_SUFFIX = {UserRole.ADMIN: " [Admin]"}
+
+# /list_meetings status column
+_ACTIVE_LABEL = {True: "Active", False: "Inactive"}
+
+
+async def _run_report(func, *args):
+    """Run a blocking ExportService call on the export pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_export_pool, func, *args)
+
+
+# Last formatted timestamp per format string, as (epoch second, text)
+_now_text_cache: Dict[str, Tuple[int, str]] = {}
+
+
+def _format_now(fmt: str) -> str:
+    """
+    Format the current time in the configured timezone, reusing the result
+    within the same second.
+    
+    Args:
+        fmt: strftime format string
+        
+    Returns:
+        Formatted current time
+    """
+    second = int(time.time())
+    cached = _now_text_cache.get(fmt)
+    if cached is not None and cached[0] == second:
+        return cached[1]
+    text = datetime.fromtimestamp(second, config.timezone.tzinfo).strftime(fmt)
+    _now_text_cache[fmt] = (second, text)
+    return text
+
+
+# Today's date as dd/mm/yyyy, with the timestamp of the next midnight
+# in the configured timezone
+_today_text_cache: Tuple[float, str] = (0.0, "")
+
+
+def _today_text() -> str:
+    """
+    Format today's date in the configured timezone, recomputing it only after midnight.
+    
+    Returns:
+        Today's date as dd/mm/yyyy
+    """
+    global _today_text_cache
+    expires_at, text = _today_text_cache
+    if time.time() < expires_at:
+        return text
+    tz = config.timezone.tzinfo
+    today = datetime.now(tz).date()
+    next_midnight = tz.localize(
+        datetime.combine(today + timedelta(days=1), datetime.min.time())
+    )
+    text = today.strftime("%d/%m/%Y")
+    _today_text_cache = (next_midnight.timestamp(), text)
+    return text
+
+
+@dataclass
+class _MeetingDraft:
+    """Answers collected so far in the set_meeting conversation."""
+    title: str = ""
+    meeting_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    radius: Optional[float] = None
+    meeting_type: Optional[MeetingType] = None
+
+
+# user_data key holding the set_meeting draft
+_MEETING_DRAFT_KEY = "meeting_draft"
+
+
+def _meeting_draft(user_data: dict) -> _MeetingDraft:
+    """Return the set_meeting draft in user_data, creating it if missing."""
+    draft = user_data.get(_MEETING_DRAFT_KEY)
+    if draft is None:
+        draft = user_data[_MEETING_DRAFT_KEY] = _MeetingDraft()
+    return draft
+
+
+def _clear_meeting_draft(user_data: dict) -> None:
+    """Remove the set_meeting draft from user_data."""
+    user_data.pop(_MEETING_DRAFT_KEY, None)
+
+
+# Answers accepted at the meeting type step of set_meeting
+_MEETING_TYPE_CHOICES = {
+    "1": MeetingType.REGULAR,
+    "2": MeetingType.SUPPORT,
+    "3": MeetingType.EVENT,
+}
+
+# "HH:MM DD/MM/YYYY", as typed in the set_meeting conversation
+MEETING_DATETIME_FORMAT = "%H:%M %d/%m/%Y"
+_MEETING_DATETIME_RE = re.compile(r"(\d{1,2}):(\d{1,2}) (\d{1,2})/(\d{1,2})/(\d{4})")
+
+
+def _parse_meeting_datetime(text: str) -> datetime:
+    """
+    Parse a meeting time in HH:MM DD/MM/YYYY format.
+    
+    Uses a precompiled regex for the common case and falls back to
+    strptime for anything else it would accept (e.g. extra spaces).
+    
+    Args:
+        text: User input
+        
+    Returns:
+        Parsed datetime
+        
+    Raises:
+        ValueError: If the input is not a valid date/time
+    """
+    match = _MEETING_DATETIME_RE.fullmatch(text)
+    if match is None:
+        return datetime.strptime(text, MEETING_DATETIME_FORMAT)
+    hour, minute, day, month, year = map(int, match.groups())
+    return datetime(year, month, day, hour, minute)
+
 
 # =============================================================================
 # CONVERSATION STATES FOR SET_MEETING
@@ -60,9 +226,7 @@ logger = logging.getLogger(__name__)
 # USER MANAGEMENT COMMANDS
 # =============================================================================
 
-@require_registration
-@require_admin
-@log_action("approve_user")
+@admin_action("approve_user")
 async def approve_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -90,7 +254,7 @@ async def approve_command(
     
     target = UserService.get_user(target_id)
     if not target:
-        await update.message.reply_text(f"Khong tim thay user ID: {target_id}")
+        await update.message.reply_text(Messages.ADMIN_USER_NOT_FOUND.format(user_id=target_id))
         return
     
     if target.status != UserStatus.PENDING:
@@ -117,9 +281,7 @@ async def approve_command(
         await update.message.reply_text("Khong the phe duyet user nay.")
 
 
-@require_registration
-@require_admin
-@log_action("reject_user")
+@admin_action("reject_user")
 async def reject_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -145,7 +307,7 @@ async def reject_command(
     
     target = UserService.get_user(target_id)
     if not target:
-        await update.message.reply_text(f"Khong tim thay user ID: {target_id}")
+        await update.message.reply_text(Messages.ADMIN_USER_NOT_FOUND.format(user_id=target_id))
         return
     
     name = target.full_name
@@ -164,9 +326,7 @@ async def reject_command(
         await update.message.reply_text("Khong the tu choi user nay.")
 
 
-@require_registration
-@require_admin
-@log_action("ban_user")
+@admin_action("ban_user")
 async def ban_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -197,7 +357,7 @@ async def ban_command(
     
     target = UserService.get_user(target_id)
     if not target:
-        await update.message.reply_text(f"Khong tim thay user ID: {target_id}")
+        await update.message.reply_text(Messages.ADMIN_USER_NOT_FOUND.format(user_id=target_id))
         return
     
     if UserService.ban_user(target_id, update.effective_user.id):
@@ -206,9 +366,7 @@ async def ban_command(
         await update.message.reply_text("Khong the cam user nay.")
 
 
-@require_registration
-@require_admin
-@log_action("unban_user")
+@admin_action("unban_user")
 async def unban_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -234,7 +392,7 @@ async def unban_command(
     
     target = UserService.get_user(target_id)
     if not target:
-        await update.message.reply_text(f"Khong tim thay user ID: {target_id}")
+        await update.message.reply_text(Messages.ADMIN_USER_NOT_FOUND.format(user_id=target_id))
         return
     
     if target.status != UserStatus.BANNED:
@@ -251,8 +409,57 @@ async def unban_command(
 # USER LISTING COMMANDS
 # =============================================================================
 
-@require_registration
-@require_admin
+def _render_user_lines(users: List[UserRow], counts: Dict[str, int]) -> Iterator[str]:
+    """
+    Yield the /list_users output line by line.
+    
+    Args:
+        users: Users ordered by status, as from UserService.get_users_grouped()
+        counts: Per-status counts from the same call
+    """
+    yield "DANH SACH NGUOI DUNG\n"
+    
+    # Users arrive ordered by status, so each section is one contiguous run
+    for status, group in groupby(users, key=attrgetter("status")):
+        title = _USER_SECTION_TITLES.get(status)
+        if title is None:
+            continue
+        yield f"\n{title} ({counts.get(status, 0)}):"
+        # Roles are only shown for active users
+        role_suffix = _ROLE_SUFFIX if status is UserStatus.ACTIVE else {}
+        for u in group:
+            role = role_suffix.get(u.role, "")
+            yield _USER_LINE.format(name=u.full_name, role=role, user_id=u.user_id)
+    
+    # Stats summary
+    yield "\n--------------------"
+    yield (
+        f"Tong: {len(users)} | Active: {counts.get(UserStatus.ACTIVE, 0)} | "
+        f"Pending: {counts.get(UserStatus.PENDING, 0)} | Banned: {counts.get(UserStatus.BANNED, 0)}"
+    )
+
+
+def _chunk_lines(lines: Iterable[str], limit: int = MESSAGE_CHUNK_LIMIT) -> Iterator[str]:
+    """
+    Join lines into newline-separated chunks of at most limit characters.
+    
+    Args:
+        lines: Lines to join (each assumed shorter than limit)
+        limit: Maximum characters per chunk
+    """
+    buf: List[str] = []
+    size = 0
+    for line in lines:
+        if buf and size + len(line) > limit:
+            yield "\n".join(buf)
+            buf, size = [], 0
+        buf.append(line)
+        size += len(line) + 1
+    if buf:
+        yield "\n".join(buf)
+
+
+@admin_action()
 async def list_users_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -263,47 +470,18 @@ async def list_users_command(
     
     Usage: /list_users
     """
-    users = UserService.get_all_users()
+    users, counts = UserService.get_users_grouped()
     
     if not users:
         await update.message.reply_text("Chua co user nao dang ky.")
         return
     
-    # Group by status
-    active = [u for u in users if u.status == UserStatus.ACTIVE]
-    pending = [u for u in users if u.status == UserStatus.PENDING]
-    banned = [u for u in users if u.status == UserStatus.BANNED]
-    
-    lines = ["DANH SACH NGUOI DUNG\n"]
-    
-    if active:
-        lines.append(f"\nDang hoat dong ({len(active)}):")
-        for u in active:
-            role = " [Admin]" if u.role == UserRole.ADMIN else ""
-            lines.append(f"  - {u.full_name}{role}")
-            lines.append(f"    ID: {u.user_id}")
-    
-    if pending:
-        lines.append(f"\nCho duyet ({len(pending)}):")
-        for u in pending:
-            lines.append(f"  - {u.full_name}")
-            lines.append(f"    ID: {u.user_id}")
-    
-    if banned:
-        lines.append(f"\nDa cam ({len(banned)}):")
-        for u in banned:
-            lines.append(f"  - {u.full_name}")
-            lines.append(f"    ID: {u.user_id}")
-    
-    # Stats summary
-    lines.append(f"\n--------------------")
-    lines.append(f"Tong: {len(users)} | Active: {len(active)} | Pending: {len(pending)} | Banned: {len(banned)}")
-    
-    await update.message.reply_text("\n".join(lines))
+    # Sent in order, one message per chunk, to stay under Telegram's size limit
+    for chunk in _chunk_lines(_render_user_lines(users, counts)):
+        await update.message.reply_text(chunk)
 
 
-@require_registration
-@require_admin
+@admin_action()
 async def list_pending_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -322,16 +500,21 @@ async def list_pending_command(
         )
         return
     
-    await update.message.reply_text(
-        f"Co {len(pending)} user dang cho duyet:"
-    )
+    lines = [
+        f"{i}. {u.full_name} (ID: {u.user_id}) - {u.joined_at:%H:%M %d/%m/%Y}"
+        for i, u in enumerate(pending, 1)
+    ]
+    entries = [(i, u.user_id) for i, u in enumerate(pending, 1)]
     
-    for u in pending:
+    # One message per page, each with a keyboard row per user; sent in
+    # order so the numbering reads top to bottom
+    for start in range(0, len(pending), PENDING_PAGE_SIZE):
         await update.message.reply_text(
-            f"Ten: {u.full_name}\n"
-            f"ID: {u.user_id}\n"
-            f"Thoi gian dang ky: {u.joined_at.strftime('%H:%M %d/%m/%Y')}",
-            reply_markup=Keyboards.approve_reject_user(u.user_id)
+            f"Co {len(pending)} user dang cho duyet:\n\n"
+            + "\n".join(lines[start:start + PENDING_PAGE_SIZE]),
+            reply_markup=Keyboards.approve_reject_users(
+                entries[start:start + PENDING_PAGE_SIZE]
+            ),
         )
 
 
@@ -339,9 +522,7 @@ async def list_pending_command(
 # BROADCAST COMMAND
 # =============================================================================
 
-@require_registration
-@require_admin
-@log_action("broadcast")
+@admin_action("broadcast")
 async def broadcast_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -371,7 +552,7 @@ async def broadcast_command(
         return
     
     # Confirm before sending
-    await update.message.reply_text(
+    status = await update.message.reply_text(
         f"Se gui tin nhan den {len(active_users)} nguoi:\n\n"
         f"--------------------\n"
         f"{message}\n"
@@ -379,30 +560,32 @@ async def broadcast_command(
         f"Dang gui..."
     )
     
-    # Send to all users
-    success_count = 0
-    fail_count = 0
-    
     broadcast_message = (
         f"THONG BAO TU ADMIN\n"
         f"--------------------\n\n"
         f"{message}\n\n"
         f"--------------------\n"
-        f"{datetime.now().strftime('%H:%M %d/%m/%Y')}"
+        f"{_format_now('%H:%M %d/%m/%Y')}"
     )
     
-    for target_user in active_users:
-        try:
-            await context.bot.send_message(
-                chat_id=target_user.user_id,
-                text=broadcast_message
-            )
-            success_count += 1
-        except Exception as e:
-            logger.error(
-                f"Failed to send broadcast to {target_user.user_id}: {e}"
-            )
-            fail_count += 1
+    # Send in the background so this update finishes right away
+    context.application.create_task(
+        _broadcast_and_report(update, context, active_users, broadcast_message, status),
+        update=update,
+    )
+
+
+@concurrency_limit(HEAVY_COMMAND_CONCURRENCY)
+async def _broadcast_and_report(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    recipients: List[User],
+    text: str,
+    status: Message,
+) -> None:
+    """Run a broadcast and reply to the admin with the delivery counts."""
+    success_count = await _send_broadcast(context, recipients, text, status)
+    fail_count = len(recipients) - success_count
     
     await update.message.reply_text(
         f"Da gui thanh cong: {success_count}\n"
@@ -410,12 +593,97 @@ async def broadcast_command(
     )
 
 
+async def _send_retrying_once(
+    context: ContextTypes.DEFAULT_TYPE,
+    chat_id: int,
+    text: str,
+) -> None:
+    """
+    Send a message, resending once after Telegram's flood-control wait.
+    
+    The application's rate limiter already retries 429s a few times; this
+    catches the RetryAfter that escapes it under a sustained burst.
+    """
+    try:
+        await context.bot.send_message(chat_id=chat_id, text=text)
+    except RetryAfter as e:
+        delay = e.retry_after
+        if isinstance(delay, timedelta):
+            delay = delay.total_seconds()
+        logger.warning(f"Flood control on {chat_id}, resending in {delay}s")
+        await asyncio.sleep(delay)
+        await context.bot.send_message(chat_id=chat_id, text=text)
+
+
+async def _send_broadcast(
+    context: ContextTypes.DEFAULT_TYPE,
+    recipients: List[User],
+    text: str,
+    status: Message,
+) -> int:
+    """
+    Send a message to many users concurrently.
+    
+    A fixed pool of BROADCAST_MAX_IN_FLIGHT workers drains a queue of
+    recipients, so only that many sends (and coroutines) exist at once
+    however large the audience; the application's rate limiter keeps
+    the send rate under Telegram's global limit. The status message is
+    edited every BROADCAST_PROGRESS_EVERY completions.
+    
+    Returns:
+        Number of messages delivered successfully.
+    """
+    queue: "asyncio.Queue[User]" = asyncio.Queue()
+    for target_user in recipients:
+        queue.put_nowait(target_user)
+    
+    total = len(recipients)
+    done = 0
+    delivered = 0
+    blocked = 0
+    # (user_id, error type) per failed send, logged once at the end
+    failures: List[Tuple[int, str]] = []
+    
+    async def _worker() -> None:
+        nonlocal done, delivered, blocked
+        while True:
+            try:
+                target_user = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            
+            try:
+                await _send_retrying_once(context, target_user.user_id, text)
+                delivered += 1
+            except Exception as e:
+                # Forbidden means the user blocked the bot; expected
+                blocked += isinstance(e, Forbidden)
+                failures.append((target_user.user_id, type(e).__name__))
+            
+            done += 1
+            if done % BROADCAST_PROGRESS_EVERY == 0 and done < total:
+                try:
+                    await status.edit_text(f"Dang gui... {done}/{total}")
+                except Exception:
+                    pass
+    
+    await asyncio.gather(*(
+        _worker() for _ in range(min(BROADCAST_MAX_IN_FLIGHT, total))
+    ))
+    
+    if failures:
+        logger.warning(
+            f"Broadcast: {len(failures)}/{total} failed ({blocked} blocked the bot); "
+            f"sample={failures[:BROADCAST_FAILURE_SAMPLE]}"
+        )
+    return delivered
+
+
 # =============================================================================
 # LOCATION MANAGEMENT COMMANDS
 # =============================================================================
 
-@require_registration
-@require_admin
+@admin_action()
 async def list_locations_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -435,29 +703,30 @@ async def list_locations_command(
         )
         return
     
-    lines = ["DANH SACH DIA DIEM (Active)\n"]
+    for chunk in _chunk_lines(_render_location_lines(locations)):
+        await update.message.reply_text(chunk)
+
+
+def _render_location_lines(locations: Iterable[Location]) -> Iterator[str]:
+    """
+    Yield the /list_locations output, one block per location.
     
+    Args:
+        locations: Active locations to list
+    """
+    yield "DANH SACH DIA DIEM (Active)\n"
     for loc in locations:
-        coords = GeolocationService.format_coordinates(
-            loc.latitude, loc.longitude
-        )
-        maps_link = GeolocationService.get_google_maps_link(
-            loc.latitude, loc.longitude
-        )
-        
-        lines.append(
+        coords = GeolocationService.format_coordinates(loc.latitude, loc.longitude)
+        maps_link = GeolocationService.get_google_maps_link(loc.latitude, loc.longitude)
+        yield (
             f"\n{loc.id}. {loc.name}\n"
             f"   Toa do: {coords}\n"
             f"   Ban kinh: {loc.radius}m\n"
             f"   Maps: {maps_link}"
         )
-    
-    await update.message.reply_text("\n".join(lines))
 
 
-@require_registration
-@require_admin
-@log_action("delete_location")
+@admin_action("delete_location")
 async def delete_location_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -484,7 +753,7 @@ async def delete_location_command(
     
     location = GeolocationService.get_location(location_id)
     if not location:
-        await update.message.reply_text(f"Khong tim thay dia diem ID: {location_id}")
+        await update.message.reply_text(Messages.ADMIN_LOCATION_NOT_FOUND.format(location_id=location_id))
         return
     
     if GeolocationService.delete_location(location_id):
@@ -499,9 +768,7 @@ async def delete_location_command(
 # REPORT COMMANDS
 # =============================================================================
 
-@require_registration
-@require_admin
-@log_action("today_report")
+@admin_action("today_report")
 async def today_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -512,14 +779,12 @@ async def today_command(
     
     Usage: /today
     """
-    report = ExportService.get_daily_report()
+    report = await _run_report(ExportService.get_daily_report)
     message = ExportService.format_daily_report(report)
     await update.message.reply_text(message)
 
 
-@require_registration
-@require_admin
-@log_action("export_excel")
+@admin_action("export_excel")
 async def export_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -530,9 +795,7 @@ async def export_command(
     
     Usage: /export_excel [month] [year]
     """
-    from telegram import InputFile
-    
-    now = datetime.now()
+    now = AttendanceService.get_current_time_naive()
     year = now.year
     month = now.month
     
@@ -554,8 +817,23 @@ async def export_command(
         f"Dang tao bao cao thang {month}/{year}..."
     )
     
+    # Build and send in the background so this update finishes right away
+    context.application.create_task(
+        _build_and_send_excel(update, year, month, status),
+        update=update,
+    )
+
+
+@concurrency_limit(HEAVY_COMMAND_CONCURRENCY)
+async def _build_and_send_excel(update: Update, year: int, month: int, status: Message) -> None:
+    """Generate the monthly Excel report and send it to the admin."""
+    from telegram import InputFile
+    
     try:
-        excel_file = ExportService.generate_monthly_excel(year, month)
+        excel_file = await asyncio.wait_for(
+            _run_report(ExportService.generate_monthly_excel, year, month),
+            timeout=EXPORT_TIMEOUT_SECONDS,
+        )
         filename = f"attendance_{year}_{month:02d}.xlsx"
         
         await update.message.reply_document(
@@ -565,13 +843,34 @@ async def export_command(
         
         await status.delete()
         
+    except asyncio.TimeoutError:
+        logger.error(f"Export {month}/{year} timed out after {EXPORT_TIMEOUT_SECONDS}s")
+        await status.edit_text(
+            "Bao cao qua lon, khong the tao kip. Vui long thu lai sau."
+        )
     except Exception as e:
         logger.error(f"Export failed: {e}")
         await status.edit_text(f"Loi: {str(e)}")
 
 
-@require_registration
-@require_admin
+_STATS_TEMPLATE = """THONG KE HE THONG
+
+Nhan su:
+  - Tong: {total}
+  - Hoat dong: {active}
+  - Cho duyet: {pending}
+  - Da cam: {banned}
+  - Admin: {admins}
+
+Hom nay ({today}):
+  - Check-in: {checked_in}/{total_employees}
+  - Dung gio: {on_time}
+  - Muon: {late}
+  - Check-out: {checked_out}
+"""
+
+
+@admin_action()
 async def stats_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -582,25 +881,22 @@ async def stats_command(
     
     Usage: /stats
     """
+    # Start the daily report on the export pool, then read the (cached)
+    # user counts on the loop while it runs; the cache is loop-only.
+    loop = asyncio.get_running_loop()
+    report_future = loop.run_in_executor(_export_pool, ExportService.get_daily_report)
     user_stats = UserService.get_user_stats()
-    today_report = ExportService.get_daily_report()
-    now = datetime.now()
-    
-    stats_text = f"""THONG KE HE THONG
-
-Nhan su:
-  - Tong: {user_stats['total']}
-  - Hoat dong: {user_stats['active']}
-  - Cho duyet: {user_stats['pending']}
-  - Da cam: {user_stats['banned']}
-  - Admin: {user_stats['admins']}
-
-Hom nay ({now.strftime('%d/%m/%Y')}):
-  - Check-in: {today_report.checked_in}/{today_report.total_employees}
-  - Dung gio: {today_report.on_time}
-  - Muon: {today_report.late}
-  - Check-out: {today_report.checked_out}
-"""
+    today_report = await report_future
+    
+    stats_text = _STATS_TEMPLATE.format_map({
+        **user_stats,
+        "today": _today_text(),
+        "checked_in": today_report.checked_in,
+        "total_employees": today_report.total_employees,
+        "on_time": today_report.on_time,
+        "late": today_report.late,
+        "checked_out": today_report.checked_out,
+    })
     
     await update.message.reply_text(stats_text)
 
@@ -609,33 +905,40 @@ Hom nay ({now.strftime('%d/%m/%Y')}):
 # MEETING COMMANDS
 # =============================================================================
 
-@require_registration
-@require_admin
-async def list_meetings_command(
-    update: Update,
-    context: ContextTypes.DEFAULT_TYPE,
-    user: User = None
-) -> None:
+def _render_meetings_page(page: int) -> Tuple[str, Optional[InlineKeyboardMarkup]]:
     """
-    List all upcoming meetings.
+    Render one page of upcoming meetings for /list_meetings.
     
-    Usage: /list_meetings
+    Args:
+        page: Page number (1-based)
+        
+    Returns:
+        Message text and pagination keyboard (None if single page)
     """
-    meetings = MeetingService.get_upcoming_meetings(days=30)
+    # Fetch one extra row to know whether a next page exists
+    meetings = MeetingService.get_upcoming_meetings(
+        AttendanceService.get_current_time_naive(),
+        days=30,
+        limit=MEETINGS_PAGE_SIZE + 1,
+        offset=(page - 1) * MEETINGS_PAGE_SIZE,
+    )
+    has_next = len(meetings) > MEETINGS_PAGE_SIZE
+    meetings = meetings[:MEETINGS_PAGE_SIZE]
     
     if not meetings:
-        await update.message.reply_text(
+        if page > 1:
+            return f"Khong co buoi hop nao o trang {page}.", None
+        return (
             "Khong co buoi hop nao sap toi.\n"
             "Su dung /set_meeting de tao buoi hop moi."
-        )
-        return
+        ), None
     
-    lines = ["DANH SACH BUOI HOP\n"]
+    lines = [f"DANH SACH BUOI HOP (trang {page})\n"]
     
     for meeting in meetings:
         time_str = meeting.meeting_time.strftime("%H:%M %d/%m/%Y")
         end_str = meeting.end_time.strftime("%H:%M %d/%m/%Y") if meeting.end_time else "N/A"
-        status = "Active" if meeting.is_active else "Inactive"
+        status = _ACTIVE_LABEL[bool(meeting.is_active)]
         type_display = MeetingService.get_meeting_type_display(meeting.meeting_type)
         lines.append(
             f"\n{meeting.id}. {meeting.title}\n"
@@ -646,11 +949,37 @@ async def list_meetings_command(
             f"   Trang thai: {status}"
         )
     
-    await update.message.reply_text("\n".join(lines))
+    keyboard = Keyboards.pagination(CallbackData.LIST_MEETINGS_PAGE, page, has_next)
+    return "\n".join(lines), keyboard
 
 
-@require_registration
-@require_admin
+@admin_action()
+async def list_meetings_command(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    user: User = None
+) -> None:
+    """
+    List upcoming meetings, one page at a time.
+    
+    Usage: /list_meetings [page]
+    """
+    page = 1
+    if context.args:
+        try:
+            page = max(1, int(context.args[0]))
+        except ValueError:
+            await update.message.reply_text(
+                "Su dung: /list_meetings [trang]\n"
+                "Vi du: /list_meetings 2"
+            )
+            return
+    
+    text, keyboard = _render_meetings_page(page)
+    await update.message.reply_text(text, reply_markup=keyboard)
+
+
+@admin_action()
 async def delete_meeting_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -671,20 +1000,11 @@ async def delete_meeting_command(
         await update.message.reply_text("ID khong hop le.")
         return
     
-    meeting = MeetingService.get_meeting(meeting_id)
-    if not meeting:
+    if not MeetingService.delete_meeting_with_location(meeting_id):
         await update.message.reply_text("Khong tim thay buoi hop.")
         return
     
-    ok = MeetingService.delete_meeting(meeting_id)
-    
-    if meeting.location_id:
-        GeolocationService.delete_location(meeting.location_id)
-    
-    if ok:
-        await update.message.reply_text(f"Da xoa buoi hop #{meeting_id}. Dia diem da vo hieu hoa.")
-    else:
-        await update.message.reply_text("Khong the xoa buoi hop.")
+    await update.message.reply_text(f"Da xoa buoi hop #{meeting_id}. Dia diem da vo hieu hoa.")
 
 
 async def ranking_command(
@@ -697,9 +1017,11 @@ async def ranking_command(
     
     Usage: /ranking
     """
-    now = datetime.now()
+    month, year = PointService.get_current_month_year()
     
-    rankings = PointService.get_all_rankings(month=now.month, year=now.year)
+    rankings = PointService.get_all_rankings(
+        month=month, year=year, limit=RANKING_TOP_N
+    )
     
     if not rankings:
         await update.message.reply_text(
@@ -707,9 +1029,9 @@ async def ranking_command(
         )
         return
     
-    lines = [Messages.RANKING_HEADER.format(month=now.month, year=now.year)]
+    lines = [Messages.RANKING_HEADER.format(month=month, year=year)]
     
-    for ranking in rankings[:20]:  # Top 20
+    for ranking in rankings:
         rank_title = PointService.get_rank_title(ranking.rank)
         lines.append(f"#{ranking.rank} {ranking.user_name} - {rank_title}\n")
     
@@ -724,12 +1046,12 @@ async def set_meeting_start(update: Update, context: ContextTypes.DEFAULT_TYPE)
     """Start the set_meeting conversation."""
     user_id = update.effective_user.id
     
-    # Verify admin
-    if not config.admin.is_super_admin(user_id):
-        admin = UserService.get_user(user_id)
-        if not admin or admin.role != UserRole.ADMIN:
-            await update.message.reply_text(Messages.ADMIN_ONLY)
-            return ConversationHandler.END
+    # Verify admin (super admins need no user row)
+    if not UserService.is_admin(user_id):
+        await update.message.reply_text(Messages.ADMIN_ONLY)
+        return ConversationHandler.END
+    
+    context.user_data[_MEETING_DRAFT_KEY] = _MeetingDraft()
     
     await update.message.reply_text(
         "TAO BUOI HOP MOI\n\n"
@@ -750,9 +1072,10 @@ async def set_meeting_title(update: Update, context: ContextTypes.DEFAULT_TYPE)
             "Da huy tao buoi hop.",
             reply_markup=Keyboards.admin_menu()
         )
+        _clear_meeting_draft(context.user_data)
         return ConversationHandler.END
     
-    context.user_data["meeting_title"] = title
+    _meeting_draft(context.user_data).title = title
     
     await update.message.reply_text(
         "Nhap thoi gian hop (HH:MM DD/MM/YYYY)\n"
@@ -773,23 +1096,24 @@ async def set_meeting_time(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             "Da huy tao buoi hop.",
             reply_markup=Keyboards.admin_menu()
         )
+        _clear_meeting_draft(context.user_data)
         return ConversationHandler.END
     
     try:
-        meeting_time = datetime.strptime(time_input, "%H:%M %d/%m/%Y")
+        meeting_time = _parse_meeting_datetime(time_input)
     except ValueError:
         await update.message.reply_text(
             "Dinh dang khong hop le!\nNhap theo HH:MM DD/MM/YYYY (VD: 14:00 31/12/2025)"
         )
         return MEETING_TIME
     
-    if meeting_time <= datetime.now():
+    if meeting_time <= AttendanceService.get_current_time_naive():
         await update.message.reply_text(
             "Thoi gian da qua. Vui long nhap thoi gian trong tuong lai (HH:MM DD/MM/YYYY):"
         )
         return MEETING_TIME
     
-    context.user_data["meeting_time"] = meeting_time
+    _meeting_draft(context.user_data).meeting_time = meeting_time
     
     await update.message.reply_text(
         "Nhap thoi gian KET THUC hop (HH:MM DD/MM/YYYY):",
@@ -807,24 +1131,25 @@ async def set_meeting_end(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             "Da huy tao buoi hop.",
             reply_markup=Keyboards.admin_menu()
         )
+        _clear_meeting_draft(context.user_data)
         return ConversationHandler.END
     
     try:
-        end_time = datetime.strptime(time_input, "%H:%M %d/%m/%Y")
+        end_time = _parse_meeting_datetime(time_input)
     except ValueError:
         await update.message.reply_text(
             "Dinh dang khong hop le!\nNhap theo HH:MM DD/MM/YYYY (VD: 16:00 31/12/2025)"
         )
         return MEETING_END
     
-    start_time = context.user_data.get("meeting_time")
-    if not start_time or end_time <= start_time:
+    draft = _meeting_draft(context.user_data)
+    if not draft.meeting_time or end_time <= draft.meeting_time:
         await update.message.reply_text(
             "Thoi gian ket thuc phai SAU thoi gian bat dau.\nNhap lai HH:MM DD/MM/YYYY:"
         )
         return MEETING_END
     
-    context.user_data["meeting_end"] = end_time
+    draft.end_time = end_time
     
     await update.message.reply_text(
         "Gui GPS dia diem hop (bam 'Gui vi tri'):",
@@ -843,9 +1168,10 @@ async def set_meeting_location(update: Update, context: ContextTypes.DEFAULT_TYP
         return MEETING_LOCATION
     
     loc = update.message.location
-    context.user_data["meeting_lat"] = loc.latitude
-    context.user_data["meeting_lon"] = loc.longitude
-    context.user_data["meeting_radius"] = config.attendance.geofence_default_radius
+    draft = _meeting_draft(context.user_data)
+    draft.latitude = loc.latitude
+    draft.longitude = loc.longitude
+    draft.radius = config.attendance.geofence_default_radius
     
     await update.message.reply_text(
         "Chon loai buoi hop:\n"
@@ -868,38 +1194,29 @@ async def set_meeting_type(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             "Da huy tao buoi hop.",
             reply_markup=Keyboards.admin_menu()
         )
+        _clear_meeting_draft(context.user_data)
         return ConversationHandler.END
     
-    type_map = {
-        "1": MeetingType.REGULAR,
-        "2": MeetingType.SUPPORT,
-        "3": MeetingType.EVENT,
-    }
-    
-    meeting_type = type_map.get(type_input)
+    meeting_type = _MEETING_TYPE_CHOICES.get(type_input)
     if not meeting_type:
         await update.message.reply_text("Nhap 1, 2 hoac 3:")
         return MEETING_TYPE
     
-    context.user_data["meeting_type"] = meeting_type
+    draft = _meeting_draft(context.user_data)
+    draft.meeting_type = meeting_type
     
     # Build confirmation message
-    title = context.user_data["meeting_title"]
-    meeting_time = context.user_data["meeting_time"]
-    meeting_end = context.user_data.get("meeting_end")
-    latitude = context.user_data["meeting_lat"]
-    longitude = context.user_data["meeting_lon"]
-    radius = context.user_data.get("meeting_radius", config.attendance.geofence_default_radius)
+    radius = draft.radius or config.attendance.geofence_default_radius
     points = MEETING_POINTS.get(meeting_type, 5)
     type_display = MeetingService.get_meeting_type_display(meeting_type)
-    time_str = meeting_time.strftime("%H:%M %d/%m/%Y")
-    end_str = meeting_end.strftime("%H:%M %d/%m/%Y") if meeting_end else "N/A"
-    coords = GeolocationService.format_coordinates(latitude, longitude)
+    time_str = draft.meeting_time.strftime("%H:%M %d/%m/%Y")
+    end_str = draft.end_time.strftime("%H:%M %d/%m/%Y") if draft.end_time else "N/A"
+    coords = GeolocationService.format_coordinates(draft.latitude, draft.longitude)
     
     confirmation = (
         "XAC NHAN TAO BUOI HOP\n"
         "====================\n\n"
-        f"Tieu de: {title}\n"
+        f"Tieu de: {draft.title}\n"
         f"Bat dau: {time_str}\n"
         f"Ket thuc: {end_str}\n"
         f"Dia diem: {coords} (ban kinh {radius:.0f}m)\n"
@@ -925,16 +1242,13 @@ async def set_meeting_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE
             "Da huy tao buoi hop.",
             reply_markup=Keyboards.admin_menu()
         )
+        _clear_meeting_draft(context.user_data)
         return ConversationHandler.END
     
     # Create meeting
-    title = context.user_data["meeting_title"]
-    meeting_type = context.user_data["meeting_type"]
-    meeting_time = context.user_data["meeting_time"]
-    meeting_end = context.user_data.get("meeting_end")
-    latitude = context.user_data.get("meeting_lat")
-    longitude = context.user_data.get("meeting_lon")
-    radius = context.user_data.get("meeting_radius", config.attendance.geofence_default_radius)
+    draft = _meeting_draft(context.user_data)
+    title = draft.title
+    radius = draft.radius or config.attendance.geofence_default_radius
     user_id = update.effective_user.id
     
     location_name = f"Dia diem {title}"
@@ -942,8 +1256,8 @@ async def set_meeting_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE
     try:
         new_location = GeolocationService.create_location(
             name=location_name,
-            latitude=latitude,
-            longitude=longitude,
+            latitude=draft.latitude,
+            longitude=draft.longitude,
             radius=radius,
             created_by=user_id
         )
@@ -952,9 +1266,9 @@ async def set_meeting_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE
         meeting = MeetingService.create_meeting(
             title=title,
             location=new_location.name,
-            meeting_time=meeting_time,
-            end_time=meeting_end,
-            meeting_type=meeting_type,
+            meeting_time=draft.meeting_time,
+            end_time=draft.end_time,
+            meeting_type=draft.meeting_type,
             created_by=user_id,
             location_id=location_id,
             latitude=new_location.latitude,
@@ -981,13 +1295,7 @@ async def set_meeting_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE
         )
     
     # Clean up user data
-    context.user_data.pop("meeting_title", None)
-    context.user_data.pop("meeting_time", None)
-    context.user_data.pop("meeting_end", None)
-    context.user_data.pop("meeting_lat", None)
-    context.user_data.pop("meeting_lon", None)
-    context.user_data.pop("meeting_radius", None)
-    context.user_data.pop("meeting_type", None)
+    _clear_meeting_draft(context.user_data)
     
     return ConversationHandler.END
 
@@ -1000,15 +1308,7 @@ async def set_meeting_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE)
     )
     
     # Clean up user data
-    context.user_data.pop("meeting_title", None)
-    context.user_data.pop("meeting_location", None)
-    context.user_data.pop("meeting_location_id", None)
-    context.user_data.pop("meeting_lat", None)
-    context.user_data.pop("meeting_lon", None)
-    context.user_data.pop("meeting_radius", None)
-    context.user_data.pop("meeting_type", None)
-    context.user_data.pop("meeting_time", None)
-    context.user_data.pop("meeting_end", None)
+    _clear_meeting_draft(context.user_data)
     
     return ConversationHandler.END
 
@@ -1029,10 +1329,10 @@ set_meeting_handler = ConversationHandler(
     },
     fallbacks=[
         CommandHandler("cancel", set_meeting_cancel),
-        MessageHandler(filters.Regex("^Huy$"), set_meeting_cancel),
+        MessageHandler(_CANCEL_FILTER, set_meeting_cancel),
     ],
     name="set_meeting_conversation",
-    persistent=False,
+    persistent=config.bot.use_persistence,
 )
 
 
@@ -1040,19 +1340,7 @@ set_meeting_handler = ConversationHandler(
 # HELP COMMAND
 # =============================================================================
 
-@require_registration
-@require_admin
-async def help_admin_command(
-    update: Update,
-    context: ContextTypes.DEFAULT_TYPE,
-    user: User = None
-) -> None:
-    """
-    Show admin help.
-    
-    Usage: /help_admin
-    """
-    help_text = """LENH QUAN TRI
+_HELP_ADMIN_TEXT = """LENH QUAN TRI
 
 Quan ly User:
   /approve <id> - Duyet user
@@ -1079,179 +1367,278 @@ Khac:
   /broadcast <tin> - Gui thong bao
   /help_admin - Tro giup nay
 """
+
+
+@admin_action()
+async def help_admin_command(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    user: User = None
+) -> None:
+    """
+    Show admin help.
     
-    await update.message.reply_text(help_text)
+    Usage: /help_admin
+    """
+    await update.message.reply_text(_HELP_ADMIN_TEXT)
 
 
 # =============================================================================
 # CALLBACK QUERY HANDLER
 # =============================================================================
 
-async def admin_callback_handler(
-    update: Update,
-    context: ContextTypes.DEFAULT_TYPE
+async def _notify_user(
+    context: ContextTypes.DEFAULT_TYPE,
+    chat_id: int,
+    text: str,
+    reply_markup=None,
 ) -> None:
     """
-    Handle inline keyboard callbacks for admin actions.
+    Send a notification to a user, logging instead of raising on failure.
+    
+    Args:
+        context: Bot context
+        chat_id: Recipient user ID
+        text: Message text
+        reply_markup: Optional keyboard
     """
-    query = update.callback_query
-    await query.answer()
+    try:
+        await context.bot.send_message(chat_id=chat_id, text=text, reply_markup=reply_markup)
+    except Exception as e:
+        logger.error(f"Failed to notify user {chat_id}: {e}")
 
-    async def _edit_query_message(text: str):
-        """
-        Safely edit the original message (supports photo captions).
-        
-        Falls back to sending a new message if editing fails.
-        """
-        try:
-            if query.message and (query.message.caption is not None or query.message.photo):
-                return await query.edit_message_caption(caption=text)
-            return await query.edit_message_text(text)
-        except BadRequest as e:
-            # Fallback to text edit, ignore "not modified" noise
-            if "message is not modified" in str(e).lower():
-                return
-            try:
-                return await query.edit_message_text(text)
-            except Exception as inner:
-                logger.error(f"Failed to edit callback message: {inner}")
-        except Exception as e:
-            logger.error(f"Failed to edit callback message: {e}")
-        
-        # Final fallback: send a new message to the admin
-        try:
-            await query.message.reply_text(text)
-        except Exception:
-            pass
-    
-    user_id = update.effective_user.id
-    
-    # Verify admin
-    if not config.admin.is_super_admin(user_id):
-        admin = UserService.get_user(user_id)
-        if not admin or admin.role != UserRole.ADMIN:
-            await _edit_query_message("Ban khong co quyen.")
-            return
+
+async def _resolve_pending_row(query: CallbackQuery, target_id: int, text: str) -> bool:
+    """
+    Handle a decision made from a multi-user /list_pending message.
     
-    data = query.data
-    prefix, args = CallbackData.parse(data)
+    Drops the decided user's row from the keyboard and replies with the
+    result, so the remaining rows stay usable.
     
-    # Handle APPROVE_USER
-    if prefix == CallbackData.APPROVE_USER:
-        target_id = int(args[0])
-        target = UserService.get_user(target_id)
+    Args:
+        query: Callback query from the pending list
+        target_id: User that was approved or rejected
+        text: Result text to send
         
-        if not target:
-            await _edit_query_message("User khong ton tai.")
+    Returns:
+        True if the message was a multi-user list and has been handled
+    """
+    markup = query.message.reply_markup if query.message else None
+    if not markup or len(markup.inline_keyboard) < 2:
+        return False
+    
+    suffix = f":{target_id}"
+    rows = [
+        row for row in markup.inline_keyboard
+        if not any((button.callback_data or "").endswith(suffix) for button in row)
+    ]
+    try:
+        await query.edit_message_reply_markup(InlineKeyboardMarkup(rows) if rows else None)
+    except BadRequest as e:
+        if "message is not modified" not in str(e).lower():
+            logger.error(f"Failed to update pending list keyboard: {e}")
+    await query.message.reply_text(text)
+    return True
+
+
+async def _edit_query_message(query: CallbackQuery, text: str) -> None:
+    """
+    Safely edit the callback's original message (supports photo captions).
+    
+    Falls back to sending a new message if editing fails.
+    """
+    try:
+        if query.message and (query.message.caption is not None or query.message.photo):
+            await query.edit_message_caption(caption=text)
             return
-        
-        if UserService.approve_user(target_id, user_id):
-            await _edit_query_message(f"Da duyet: {target.full_name}")
-            
-            try:
-                await context.bot.send_message(
-                    chat_id=target_id,
-                    text=Messages.REGISTRATION_APPROVED,
-                    reply_markup=Keyboards.main_menu()
-                )
-            except Exception:
-                pass
-        else:
-            await _edit_query_message("Khong the duyet user.")
-    
-    # Handle REJECT_USER
-    elif prefix == CallbackData.REJECT_USER:
-        target_id = int(args[0])
-        target = UserService.get_user(target_id)
-        
-        if not target:
-            await _edit_query_message("User khong ton tai.")
+        await query.edit_message_text(text)
+        return
+    except BadRequest as e:
+        # Fallback to text edit, ignore "not modified" noise
+        if "message is not modified" in str(e).lower():
             return
-        
-        name = target.full_name
-        
-        if UserService.reject_user(target_id, user_id):
-            await _edit_query_message(f"Da tu choi: {name}")
-            
-            try:
-                await context.bot.send_message(
-                    chat_id=target_id,
-                    text=Messages.REGISTRATION_REJECTED
-                )
-            except Exception:
-                pass
-        else:
-            await _edit_query_message("Khong the tu choi user.")
-    
-    # Handle APPROVE_EVIDENCE
-    elif prefix == CallbackData.APPROVE_EVIDENCE:
-        evidence_id = int(args[0])
-        evidence = EvidenceService.get_evidence(evidence_id)
-        
-        if not evidence:
-            await _edit_query_message("Minh chung khong ton tai.")
+        try:
+            await query.edit_message_text(text)
             return
-        
-        if EvidenceService.approve_evidence(evidence_id, user_id):
-            target_user = UserService.get_user(evidence.user_id)
-            user_name = target_user.full_name if target_user else str(evidence.user_id)
-            
-            await _edit_query_message(
+        except Exception as inner:
+            logger.error(f"Failed to edit callback message: {inner}")
+    except Exception as e:
+        logger.error(f"Failed to edit callback message: {e}")
+    
+    # Final fallback: send a new message to the admin
+    try:
+        await query.message.reply_text(text)
+    except Exception:
+        pass
+
+
+async def _show_user_result(query: CallbackQuery, target_id: int, text: str) -> None:
+    """Show an approve/reject result, keeping other rows of a pending list."""
+    if not await _resolve_pending_row(query, target_id, text):
+        await _edit_query_message(query, text)
+
+
+async def _on_approve_user(
+    query: CallbackQuery, context: ContextTypes.DEFAULT_TYPE, args: List[str], admin_id: int
+) -> None:
+    """Approve a pending user from an inline button."""
+    target_id = int(args[0])
+    target = UserService.get_user(target_id)
+    
+    if not target:
+        await _edit_query_message(query, "User khong ton tai.")
+        return
+    
+    if UserService.approve_user(target_id, admin_id):
+        await asyncio.gather(
+            _show_user_result(query, target_id, f"Da duyet: {target.full_name}"),
+            _notify_user(
+                context, target_id, Messages.REGISTRATION_APPROVED, Keyboards.main_menu()
+            ),
+        )
+    else:
+        await _edit_query_message(query, "Khong the duyet user.")
+
+
+async def _on_reject_user(
+    query: CallbackQuery, context: ContextTypes.DEFAULT_TYPE, args: List[str], admin_id: int
+) -> None:
+    """Reject (delete) a pending user from an inline button."""
+    target_id = int(args[0])
+    target = UserService.get_user(target_id)
+    
+    if not target:
+        await _edit_query_message(query, "User khong ton tai.")
+        return
+    
+    name = target.full_name
+    
+    if UserService.reject_user(target_id, admin_id):
+        await asyncio.gather(
+            _show_user_result(query, target_id, f"Da tu choi: {name}"),
+            _notify_user(context, target_id, Messages.REGISTRATION_REJECTED),
+        )
+    else:
+        await _edit_query_message(query, "Khong the tu choi user.")
+
+
+async def _on_approve_evidence(
+    query: CallbackQuery, context: ContextTypes.DEFAULT_TYPE, args: List[str], admin_id: int
+) -> None:
+    """Approve an evidence submission from an inline button."""
+    evidence_id = int(args[0])
+    evidence = EvidenceService.get_evidence_with_user(evidence_id)
+    
+    if not evidence:
+        await _edit_query_message(query, "Minh chung khong ton tai.")
+        return
+    
+    if EvidenceService.approve_evidence(evidence_id, admin_id):
+        # Update the admin's message and notify the user concurrently
+        await asyncio.gather(
+            _edit_query_message(
+                query,
                 f"Da duyet minh chung #{evidence_id}\n"
-                f"User: {user_name}\n"
+                f"User: {evidence.user_name}\n"
                 f"Diem: +{evidence.requested_points}"
-            )
-            
-            # Notify the user
-            try:
-                await context.bot.send_message(
-                    chat_id=evidence.user_id,
-                    text=Messages.EVIDENCE_APPROVED.format(
-                        id=evidence_id,
-                        points=evidence.requested_points
-                    )
-                )
-            except Exception as e:
-                logger.error(f"Failed to notify user {evidence.user_id}: {e}")
-        else:
-            await _edit_query_message("Khong the duyet minh chung (co the da duoc xu ly).")
-    
-    # Handle REJECT_EVIDENCE
-    elif prefix == CallbackData.REJECT_EVIDENCE:
-        evidence_id = int(args[0])
-        evidence = EvidenceService.get_evidence(evidence_id)
-        
-        if not evidence:
-            await _edit_query_message("Minh chung khong ton tai.")
-            return
-        
-        # For rejection, we need a reason - use a default one for inline action
-        reason = "Khong du dieu kien hoac thong tin khong chinh xac"
-        
-        if EvidenceService.reject_evidence(evidence_id, user_id, reason):
-            target_user = UserService.get_user(evidence.user_id)
-            user_name = target_user.full_name if target_user else str(evidence.user_id)
-            
-            await _edit_query_message(
+            ),
+            _notify_user(
+                context,
+                evidence.user_id,
+                Messages.EVIDENCE_APPROVED.format(
+                    id=evidence_id,
+                    points=evidence.requested_points
+                ),
+            ),
+        )
+    else:
+        await _edit_query_message(query, "Khong the duyet minh chung (co the da duoc xu ly).")
+
+
+async def _on_reject_evidence(
+    query: CallbackQuery, context: ContextTypes.DEFAULT_TYPE, args: List[str], admin_id: int
+) -> None:
+    """Reject an evidence submission from an inline button."""
+    evidence_id = int(args[0])
+    evidence = EvidenceService.get_evidence_with_user(evidence_id)
+    
+    if not evidence:
+        await _edit_query_message(query, "Minh chung khong ton tai.")
+        return
+    
+    # For rejection, we need a reason - use a default one for inline action
+    reason = "Khong du dieu kien hoac thong tin khong chinh xac"
+    
+    if EvidenceService.reject_evidence(evidence_id, admin_id, reason):
+        # Update the admin's message and notify the user concurrently
+        await asyncio.gather(
+            _edit_query_message(
+                query,
                 f"Da tu choi minh chung #{evidence_id}\n"
-                f"User: {user_name}\n"
+                f"User: {evidence.user_name}\n"
                 f"Ly do: {reason}"
-            )
-            
-            # Notify the user
-            try:
-                await context.bot.send_message(
-                    chat_id=evidence.user_id,
-                    text=Messages.EVIDENCE_REJECTED.format(
-                        id=evidence_id,
-                        reason=reason
-                    )
-                )
-            except Exception as e:
-                logger.error(f"Failed to notify user {evidence.user_id}: {e}")
-        else:
-            await _edit_query_message("Khong the tu choi minh chung (co the da duoc xu ly).")
+            ),
+            _notify_user(
+                context,
+                evidence.user_id,
+                Messages.EVIDENCE_REJECTED.format(
+                    id=evidence_id,
+                    reason=reason
+                ),
+            ),
+        )
+    else:
+        await _edit_query_message(query, "Khong the tu choi minh chung (co the da duoc xu ly).")
+
+
+async def _on_list_meetings_page(
+    query: CallbackQuery, context: ContextTypes.DEFAULT_TYPE, args: List[str], admin_id: int
+) -> None:
+    """Show another page of /list_meetings in place."""
+    text, keyboard = _render_meetings_page(max(1, int(args[0])))
+    try:
+        await query.edit_message_text(text, reply_markup=keyboard)
+    except BadRequest as e:
+        if "message is not modified" not in str(e).lower():
+            logger.error(f"Failed to edit meetings page: {e}")
+
+
+async def _on_cancel(
+    query: CallbackQuery, context: ContextTypes.DEFAULT_TYPE, args: List[str], admin_id: int
+) -> None:
+    """Dismiss an inline prompt."""
+    await _edit_query_message(query, "Da huy.")
+
+
+# Callback data prefix -> handler(query, context, args, admin_id)
+_ADMIN_CALLBACKS = {
+    CallbackData.APPROVE_USER: _on_approve_user,
+    CallbackData.REJECT_USER: _on_reject_user,
+    CallbackData.APPROVE_EVIDENCE: _on_approve_evidence,
+    CallbackData.REJECT_EVIDENCE: _on_reject_evidence,
+    CallbackData.LIST_MEETINGS_PAGE: _on_list_meetings_page,
+    CallbackData.CANCEL: _on_cancel,
+}
+
+
+async def admin_callback_handler(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """
+    Handle inline keyboard callbacks for admin actions.
+    """
+    query = update.callback_query
+    await query.answer()
+    
+    user_id = update.effective_user.id
+    
+    # Verify admin
+    if not UserService.is_admin(user_id):
+        await _edit_query_message(query, "Ban khong co quyen.")
+        return
     
-    # Handle CANCEL
-    elif prefix == CallbackData.CANCEL or data == CallbackData.CANCEL:
-        await _edit_query_message("Da huy.")
+    prefix, args = CallbackData.parse(query.data)
+    handler = _ADMIN_CALLBACKS.get(prefix)
+    if handler is not None:
+        await handler(query, context, args, user_id)
@@ -6,6 +6,8 @@ Uses ConversationHandler for check-in flow with GPS location verification.
 
 import logging
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from telegram import Update
 from telegram.ext import (
@@ -22,13 +24,72 @@ from src.services.point_service import PointService
 from src.services.user_service import UserService
 from src.services.geolocation import GeolocationService
 from src.services.anti_cheat import AntiCheatService
-from src.database import User
+from src.database import User, UserStatus
 from src.constants import Messages, KeyboardLabels
 from src.bot.keyboards import Keyboards
 from src.bot.middlewares import require_registration, require_active, log_action
+from src.config import config
 
 logger = logging.getLogger(__name__)
 
+# Reply-keyboard buttons send their label verbatim, so exact-text filters suffice
+_CHECKIN_FILTER = filters.Text([KeyboardLabels.CHECKIN])
+_CANCEL_FILTER = filters.Text([KeyboardLabels.CANCEL])
+# Meeting choices are numeric IDs; anything else is rejected before lookup
+_MEETING_ID_FILTER = filters.Regex(r'^\s*\d+\s*$')
+
+# Reply for users who may not check in, by status
+_INACTIVE_STATUS_MESSAGES = {
+    UserStatus.PENDING: Messages.REGISTRATION_PENDING,
+    UserStatus.BANNED: Messages.ACCOUNT_BANNED,
+}
+
+# user_data keys holding the in-progress check-in (plain values, so they persist)
+_CHECKIN_CTX_KEYS = (
+    'checkin_meeting_id',
+    'checkin_meeting_snapshot',
+    'checkin_meeting_options',
+)
+
+
+def _meeting_snapshot(meeting) -> dict:
+    """Copy the meeting fields the location step needs into a plain dict."""
+    return {
+        'id': meeting.id,
+        'title': meeting.title,
+        'location': meeting.location,
+        'meeting_time': meeting.meeting_time,
+        'end_time': meeting.end_time,
+        'latitude': meeting.latitude,
+        'longitude': meeting.longitude,
+        'radius': meeting.radius,
+    }
+
+
+def _clear_checkin_ctx(user_data: dict) -> None:
+    """Remove the in-progress check-in from user_data."""
+    for key in _CHECKIN_CTX_KEYS:
+        user_data.pop(key, None)
+
+
+def _fmt_hm(ts: datetime) -> str:
+    """Format a time as HH:MM without going through strftime."""
+    return f"{ts.hour:02d}:{ts.minute:02d}"
+
+
+@lru_cache(maxsize=8)
+def _format_meeting_choices(
+    rows: Tuple[Tuple[int, str, datetime, Optional[datetime]], ...],
+) -> str:
+    """Build the meeting-selection prompt from (id, title, start, end) rows."""
+    lines = ["Chon buoi hop de diem danh (nhap ID):\n"]
+    for meeting_id, title, start, end in rows:
+        start_str = _fmt_hm(start)
+        end_str = _fmt_hm(end) if end else "N/A"
+        lines.append(f"{meeting_id}. {title} ({start_str}-{end_str})")
+    return "\n".join(lines)
+
+
 # Conversation states for checkin
 CHECKIN_SELECT_MEETING = 0
 CHECKIN_WAITING_FOR_LOCATION = 1
@@ -46,25 +107,13 @@ async def _get_user_for_checkin(update: Update, context: ContextTypes.DEFAULT_TY
         )
         return None, True
     
-    # Handle status as string or enum
-    status = user.status.value if hasattr(user.status, 'value') else str(user.status)
+    status = user.status_value
     
-    if status != "active":
-        if status == "pending":
-            await update.message.reply_text(
-                Messages.REGISTRATION_PENDING,
-                reply_markup=Keyboards.main_menu()
-            )
-        elif status == "banned":
-            await update.message.reply_text(
-                Messages.ACCOUNT_BANNED,
-                reply_markup=Keyboards.main_menu()
-            )
-        else:
-            await update.message.reply_text(
-                f"Tai khoan cua ban dang o trang thai: {status}",
-                reply_markup=Keyboards.main_menu()
-            )
+    if status != UserStatus.ACTIVE:
+        message = _INACTIVE_STATUS_MESSAGES.get(status)
+        if message is None:
+            message = f"Tai khoan cua ban dang o trang thai: {status}"
+        await update.message.reply_text(message, reply_markup=Keyboards.main_menu())
         return None, True
     
     return user, False
@@ -81,8 +130,9 @@ async def checkin_start(
     
     user_id = update.effective_user.id
     
-    now = AttendanceService.get_current_time()
-    active_meetings = MeetingService.get_active_meetings(now.replace(tzinfo=None))
+    active_meetings = MeetingService.get_active_meetings(
+        AttendanceService.get_current_time_naive()
+    )
     
     if not active_meetings:
         await update.message.reply_text(
@@ -93,32 +143,31 @@ async def checkin_start(
     
     # If multiple active meetings, let user pick
     if len(active_meetings) > 1:
-        lines = ["Chon buoi hop de diem danh (nhap ID):\n"]
-        for m in active_meetings:
-            start_str = m.meeting_time.strftime('%H:%M')
-            end_str = m.end_time.strftime('%H:%M') if m.end_time else "N/A"
-            lines.append(f"{m.id}. {m.title} ({start_str}-{end_str})")
+        # Keyed by meeting content, so an edited meeting yields a fresh prompt
+        prompt = _format_meeting_choices(tuple(
+            (m.id, m.title, m.meeting_time, m.end_time) for m in active_meetings
+        ))
         await update.message.reply_text(
-            "\n".join(lines),
+            prompt,
             reply_markup=Keyboards.cancel_only()
         )
-        context.user_data['checkin_meeting_options'] = {str(m.id): m for m in active_meetings}
+        context.user_data['checkin_meeting_options'] = {
+            m.id: _meeting_snapshot(m) for m in active_meetings
+        }
         return CHECKIN_SELECT_MEETING
     
     meeting = active_meetings[0]
     
-    if AttendanceService.has_checked_in(user_id, meeting.id):
-        checkin_log = AttendanceService.get_checkin_log(user_id, meeting.id)
-        time_str = checkin_log.timestamp.strftime('%H:%M') if checkin_log else "N/A"
+    checkin_log = AttendanceService.get_checkin_log(user_id, meeting.id)
+    if checkin_log:
         await update.message.reply_text(
-            Messages.CHECKIN_ALREADY.format(time=time_str),
+            Messages.CHECKIN_ALREADY.format(time=_fmt_hm(checkin_log.timestamp)),
             reply_markup=Keyboards.main_menu()
         )
         return ConversationHandler.END
     
     context.user_data['checkin_meeting_id'] = meeting.id
-    context.user_data['checkin_meeting_title'] = meeting.title
-    context.user_data['checkin_meeting_location'] = meeting.location
+    context.user_data['checkin_meeting_snapshot'] = _meeting_snapshot(meeting)
     
     await update.message.reply_text(
         f"DIEM DANH: {meeting.title}\n\n"
@@ -148,8 +197,6 @@ async def checkin_location_received(
     
     # Get stored meeting info
     meeting_id = context.user_data.get('checkin_meeting_id')
-    meeting_title = context.user_data.get('checkin_meeting_title', 'Buoi hop')
-    meeting_location = context.user_data.get('checkin_meeting_location', '')
     
     if not meeting_id:
         await update.message.reply_text(
@@ -158,76 +205,66 @@ async def checkin_location_received(
         )
         return ConversationHandler.END
     
-    # Anti-cheat validation
-    anti_cheat_result = AntiCheatService.validate_location_message(message)
+    # Meeting snapshot taken when the meeting was chosen
+    meeting = context.user_data.get('checkin_meeting_snapshot')
+    if meeting is None:
+        db_meeting = MeetingService.get_meeting(meeting_id)
+        if not db_meeting:
+            await update.message.reply_text(
+                "Buoi hop khong ton tai hoac da bi xoa.",
+                reply_markup=Keyboards.main_menu()
+            )
+            _clear_checkin_ctx(context.user_data)
+            return ConversationHandler.END
+        meeting = _meeting_snapshot(db_meeting)
+    
+    # Anti-cheat and meeting geofence in one pass
+    check = AntiCheatService.validate_and_locate(message, meeting)
     
-    if not anti_cheat_result.is_valid:
+    if not check.is_valid:
         logger.warning(
             f"Anti-cheat failed for user {user_id}: "
-            f"{anti_cheat_result.error_code} - {anti_cheat_result.error_message}"
+            f"{check.error_code} - {check.error_message}"
         )
         await update.message.reply_text(
-            f"Loi xac thuc vi tri: {anti_cheat_result.error_message}",
+            f"Loi xac thuc vi tri: {check.error_message}",
             reply_markup=Keyboards.main_menu()
         )
         # Clear context
-        context.user_data.pop('checkin_meeting_id', None)
-        context.user_data.pop('checkin_meeting_title', None)
-        context.user_data.pop('checkin_meeting_location', None)
+        _clear_checkin_ctx(context.user_data)
         return ConversationHandler.END
     
-    # Geolocation validation
-    meeting = MeetingService.get_meeting(meeting_id)
-    if not meeting:
-        await update.message.reply_text(
-            "Buoi hop khong ton tai hoac da bi xoa.",
-            reply_markup=Keyboards.main_menu()
-        )
-        context.user_data.pop('checkin_meeting_id', None)
-        context.user_data.pop('checkin_meeting_title', None)
-        context.user_data.pop('checkin_meeting_location', None)
-        return ConversationHandler.END
+    meeting_title = meeting['title'] or 'Buoi hop'
+    location_name = meeting['location'] or ''
     
-    location_name = meeting_location
-    
-    now = AttendanceService.get_current_time().replace(tzinfo=None)
-    if meeting.meeting_time and meeting.meeting_time > now:
+    now = AttendanceService.get_current_time_naive()
+    if meeting['meeting_time'] and meeting['meeting_time'] > now:
         await update.message.reply_text(
             "Buoi hop chua bat dau. Thu lai khi den gio hop.",
             reply_markup=Keyboards.main_menu()
         )
         return ConversationHandler.END
-    if meeting.end_time and meeting.end_time < now:
+    if meeting['end_time'] and meeting['end_time'] < now:
         await update.message.reply_text(
             "Buoi hop da ket thuc. Khong the check-in.",
             reply_markup=Keyboards.main_menu()
         )
         return ConversationHandler.END
     
-    if meeting.latitude is not None and meeting.longitude is not None:
-        within_radius, distance = MeetingService.check_location_for_meeting(
-            meeting_id,
-            location.latitude,
-            location.longitude,
-        )
-        radius = meeting.radius if meeting.radius else 50.0
-        
-        if not within_radius:
+    if check.has_geofence:
+        if not check.within_radius:
             await update.message.reply_text(
-                f"Ban dang o qua xa dia diem hop!\n\n"
-                f"Dia diem: {meeting.location}\n"
-                f"Khoang cach: {distance:.0f}m\n"
-                f"Ban kinh cho phep: {radius:.0f}m\n\n"
-                f"Vui long di den dung dia diem va thu lai.",
+                Messages.CHECKIN_TOO_FAR.format(
+                    label="Dia diem",
+                    name=meeting['location'],
+                    distance=check.distance_meters,
+                    radius=check.radius_meters,
+                ),
                 reply_markup=Keyboards.main_menu()
             )
             # Clear context
-            context.user_data.pop('checkin_meeting_id', None)
-            context.user_data.pop('checkin_meeting_title', None)
-            context.user_data.pop('checkin_meeting_location', None)
+            _clear_checkin_ctx(context.user_data)
             return ConversationHandler.END
-        
-        location_name = meeting.location
     else:
         geo_result = GeolocationService.check_location_for_checkin(
             location.latitude,
@@ -237,13 +274,13 @@ async def checkin_location_received(
         if not geo_result.within_radius:
             # Location not within any valid radius
             if geo_result.location:
-                distance_str = f"{geo_result.distance_meters:.0f}m"
                 await update.message.reply_text(
-                    f"Ban dang o qua xa dia diem hop!\n\n"
-                    f"Dia diem gan nhat: {geo_result.location.name}\n"
-                    f"Khoang cach: {distance_str}\n"
-                    f"Ban kinh cho phep: {geo_result.location.radius:.0f}m\n\n"
-                    f"Vui long di den dung dia diem va thu lai.",
+                    Messages.CHECKIN_TOO_FAR.format(
+                        label="Dia diem gan nhat",
+                        name=geo_result.location.name,
+                        distance=geo_result.distance_meters,
+                        radius=geo_result.location.radius,
+                    ),
                     reply_markup=Keyboards.main_menu()
                 )
             else:
@@ -253,23 +290,20 @@ async def checkin_location_received(
                     reply_markup=Keyboards.main_menu()
                 )
             # Clear context
-            context.user_data.pop('checkin_meeting_id', None)
-            context.user_data.pop('checkin_meeting_title', None)
-            context.user_data.pop('checkin_meeting_location', None)
+            _clear_checkin_ctx(context.user_data)
             return ConversationHandler.END
         
-        location_name = geo_result.location.name if geo_result.location else meeting_location
+        if geo_result.location:
+            location_name = geo_result.location.name
     
     # Location valid - record check-in
     result = AttendanceService.record_checkin(user_id, meeting_id)
     
     # Clear context
-    context.user_data.pop('checkin_meeting_id', None)
-    context.user_data.pop('checkin_meeting_title', None)
-    context.user_data.pop('checkin_meeting_location', None)
+    _clear_checkin_ctx(context.user_data)
     
     if result.success:
-        time_str = result.attendance_log.timestamp.strftime('%H:%M')
+        time_str = _fmt_hm(result.attendance_log.timestamp)
         await update.message.reply_text(
             Messages.CHECKIN_SUCCESS.format(
                 time=time_str,
@@ -296,34 +330,27 @@ async def checkin_select_meeting(
     context: ContextTypes.DEFAULT_TYPE,
 ) -> int:
     """Handle meeting selection when multiple active meetings."""
-    choice = (update.message.text or "").strip()
     options = context.user_data.get('checkin_meeting_options', {})
-    meeting = options.get(choice)
+    meeting = options.get(int(update.message.text))
     
     if not meeting:
-        await update.message.reply_text(
-            "ID khong hop le. Nhap lai ID buoi hop:",
-            reply_markup=Keyboards.cancel_only()
-        )
-        return CHECKIN_SELECT_MEETING
+        return await checkin_invalid_meeting_id(update, context)
     
     user_id = update.effective_user.id
-    if AttendanceService.has_checked_in(user_id, meeting.id):
-        checkin_log = AttendanceService.get_checkin_log(user_id, meeting.id)
-        time_str = checkin_log.timestamp.strftime('%H:%M') if checkin_log else "N/A"
+    checkin_log = AttendanceService.get_checkin_log(user_id, meeting['id'])
+    if checkin_log:
         await update.message.reply_text(
-            Messages.CHECKIN_ALREADY.format(time=time_str),
+            Messages.CHECKIN_ALREADY.format(time=_fmt_hm(checkin_log.timestamp)),
             reply_markup=Keyboards.main_menu()
         )
         return ConversationHandler.END
     
-    context.user_data['checkin_meeting_id'] = meeting.id
-    context.user_data['checkin_meeting_title'] = meeting.title
-    context.user_data['checkin_meeting_location'] = meeting.location
+    context.user_data['checkin_meeting_id'] = meeting['id']
+    context.user_data['checkin_meeting_snapshot'] = meeting
     context.user_data.pop('checkin_meeting_options', None)
     
     await update.message.reply_text(
-        f"DIEM DANH: {meeting.title}\n\n"
+        f"DIEM DANH: {meeting['title']}\n\n"
         f"Gui GPS de xac nhan (bam 'Gui vi tri').",
         reply_markup=Keyboards.request_location()
     )
@@ -331,15 +358,25 @@ async def checkin_select_meeting(
     return CHECKIN_WAITING_FOR_LOCATION
 
 
+async def checkin_invalid_meeting_id(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+) -> int:
+    """Re-prompt when the meeting selection is not a listed ID."""
+    await update.message.reply_text(
+        "ID khong hop le. Nhap lai ID buoi hop:",
+        reply_markup=Keyboards.cancel_only()
+    )
+    return CHECKIN_SELECT_MEETING
+
+
 async def checkin_cancel(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
 ) -> int:
     """Handle cancel during check-in flow."""
     # Clear context
-    context.user_data.pop('checkin_meeting_id', None)
-    context.user_data.pop('checkin_meeting_title', None)
-    context.user_data.pop('checkin_meeting_location', None)
+    _clear_checkin_ctx(context.user_data)
     
     await update.message.reply_text(
         "Da huy diem danh!",
@@ -348,28 +385,38 @@ async def checkin_cancel(
     return ConversationHandler.END
 
 
+async def checkin_location_state(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+) -> int:
+    """Route a message in the waiting-for-location state: location or cancel."""
+    if update.message.location is not None:
+        return await checkin_location_received(update, context)
+    return await checkin_cancel(update, context)
+
+
 # Create the conversation handler for check-in
 checkin_conversation = ConversationHandler(
     entry_points=[
         CommandHandler("checkin", checkin_start),
-        MessageHandler(filters.Regex(f"^{KeyboardLabels.CHECKIN}$"), checkin_start),
+        MessageHandler(_CHECKIN_FILTER, checkin_start),
     ],
     states={
         CHECKIN_SELECT_MEETING: [
-            MessageHandler(filters.TEXT & ~filters.COMMAND, checkin_select_meeting),
-            MessageHandler(filters.Regex(f"^{KeyboardLabels.CANCEL}$"), checkin_cancel),
+            MessageHandler(_MEETING_ID_FILTER, checkin_select_meeting),
+            MessageHandler(_CANCEL_FILTER, checkin_cancel),
+            MessageHandler(filters.TEXT & ~filters.COMMAND, checkin_invalid_meeting_id),
         ],
         CHECKIN_WAITING_FOR_LOCATION: [
-            MessageHandler(filters.LOCATION, checkin_location_received),
-            MessageHandler(filters.Regex(f"^{KeyboardLabels.CANCEL}$"), checkin_cancel),
+            MessageHandler(filters.LOCATION | _CANCEL_FILTER, checkin_location_state),
         ],
     },
     fallbacks=[
-        MessageHandler(filters.Regex(f"^{KeyboardLabels.CANCEL}$"), checkin_cancel),
+        MessageHandler(_CANCEL_FILTER, checkin_cancel),
         CommandHandler("cancel", checkin_cancel),
     ],
     name="checkin_conversation",
-    persistent=False,
+    persistent=config.bot.use_persistence,
 )
 
 
@@ -385,7 +432,9 @@ async def checkout_command(
     user_id = update.effective_user.id
     
     # Get active meeting
-    meeting = MeetingService.get_active_meeting()
+    meeting = MeetingService.get_active_meeting(
+        AttendanceService.get_current_time_naive()
+    )
     
     if not meeting:
         await update.message.reply_text(
@@ -406,7 +455,7 @@ async def checkout_command(
     result = AttendanceService.record_checkout(user_id, meeting.id)
     
     if result.success:
-        time_str = result.attendance_log.timestamp.strftime('%H:%M')
+        time_str = _fmt_hm(result.attendance_log.timestamp)
         session_minutes = result.attendance_log.duration_minutes or 0
         total_minutes = AttendanceService.get_total_minutes(user_id)
         await update.message.reply_text(
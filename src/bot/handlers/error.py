@@ -4,6 +4,7 @@ Global error handler for the Telegram bot.
 Catches and logs all unhandled exceptions from handlers.
 """
 
+import asyncio
 import logging
 import html
 import traceback
@@ -17,6 +18,10 @@ from src.constants import Messages
 
 logger = logging.getLogger(__name__)
 
+# Size caps for the traceback in admin error reports
+TRACEBACK_FRAME_LIMIT = 20
+TRACEBACK_CHAR_LIMIT = 4000
+
 
 async def error_handler(
     update: object, 
@@ -37,29 +42,23 @@ async def error_handler(
         exc_info=context.error
     )
     
-    # Build error message for admins
-    tb_list = traceback.format_exception(
-        None, 
-        context.error, 
-        context.error.__traceback__
-    )
-    tb_string = "".join(tb_list)
-    
-    # Truncate if too long
-    if len(tb_string) > 4000:
-        tb_string = tb_string[:4000] + "..."
+    # Send user-friendly message to the user (before the admin reports)
+    if isinstance(update, Update) and update.effective_message:
+        try:
+            await update.effective_message.reply_text(
+                Messages.ERROR_GENERIC
+            )
+        except Exception:
+            pass  # Ignore if we can't send message
     
-    # Format update info
-    update_str = update.to_dict() if isinstance(update, Update) else str(update)
+    admin_ids = config.admin.super_admin_ids
+    if not admin_ids:
+        return
     
-    error_message = (
-        f"An exception was raised while handling an update\n\n"
-        f"<pre>update = {html.escape(str(update_str)[:1000])}</pre>\n\n"
-        f"<pre>{html.escape(tb_string)}</pre>"
-    )
+    error_message = _format_admin_report(update, context.error)
     
     # Notify super admins
-    for admin_id in config.admin.super_admin_ids:
+    async def _send_to(admin_id: int) -> None:
         try:
             await context.bot.send_message(
                 chat_id=admin_id,
@@ -69,11 +68,24 @@ async def error_handler(
         except Exception as e:
             logger.error(f"Failed to notify admin {admin_id}: {e}")
     
-    # Send user-friendly message to the user
-    if isinstance(update, Update) and update.effective_message:
-        try:
-            await update.effective_message.reply_text(
-                Messages.ERROR_GENERIC
-            )
-        except Exception:
-            pass  # Ignore if we can't send message
+    await asyncio.gather(*(_send_to(admin_id) for admin_id in admin_ids))
+
+
+def _format_admin_report(update: object, error: BaseException) -> str:
+    """Render the HTML error report sent to super admins."""
+    # Innermost frames only; the raising frame is the useful one
+    tb = traceback.TracebackException.from_exception(error, limit=-TRACEBACK_FRAME_LIMIT)
+    tb_string = "".join(tb.format())
+    
+    # Truncate if too long, keeping the end with the exception line
+    if len(tb_string) > TRACEBACK_CHAR_LIMIT:
+        tb_string = "..." + tb_string[-TRACEBACK_CHAR_LIMIT:]
+    
+    # Format update info
+    update_str = update.to_dict() if isinstance(update, Update) else update
+    
+    return (
+        f"An exception was raised while handling an update\n\n"
+        f"<pre>update = {html.escape(str(update_str)[:1000])}</pre>\n\n"
+        f"<pre>{html.escape(tb_string)}</pre>"
+    )
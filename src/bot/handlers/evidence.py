@@ -4,6 +4,7 @@ Evidence handler - Xử lý minh chứng công việc.
 ConversationHandler cho phép user gửi ảnh + caption để tạo minh chứng.
 """
 
+import asyncio
 import logging
 import re
 from telegram import Update
@@ -21,24 +22,23 @@ from src.services.user_service import UserService
 from src.constants import Messages, KeyboardLabels
 from src.bot.keyboards import Keyboards
 from src.bot.middlewares import require_registration, require_active
-from src.config import config
 
 logger = logging.getLogger(__name__)
 
+# Reply-keyboard buttons send their label verbatim, so exact-text filters suffice
+_MINHCHUNG_FILTER = filters.Text([KeyboardLabels.MINHCHUNG])
+_CANCEL_FILTER = filters.Text([KeyboardLabels.CANCEL])
+
 # Conversation states
 WAITING_FOR_PHOTO = 0
 WAITING_FOR_TYPE = 1
 
-EVIDENCE_OPTIONS = {
-    "1": ("Tham gia hoat dong tai C1-101", 5),
-    "2": ("Ho tro dien gia", 10),
-    "3": ("Hoat dong ngoai khoa lon", 15),
-    "5": ("Tham gia hoat dong tai C1-101", 5),
-    "10": ("Ho tro dien gia", 10),
-    "15": ("Hoat dong ngoai khoa lon", 15),
-    "+5": ("Tham gia hoat dong tai C1-101", 5),
-    "+10": ("Ho tro dien gia", 10),
-    "+15": ("Hoat dong ngoai khoa lon", 15),
+# Reply (option number or point value, "+" optional) -> requested points
+EVIDENCE_POINTS = {"1": 5, "2": 10, "3": 15, "5": 5, "10": 10, "15": 15}
+EVIDENCE_DESCRIPTIONS = {
+    5: "Tham gia hoat dong tai C1-101",
+    10: "Ho tro dien gia",
+    15: "Hoat dong ngoai khoa lon",
 }
 
 @require_registration
@@ -131,16 +131,16 @@ async def handle_evidence_type(
         )
         return ConversationHandler.END
     
-    choice = (update.message.text or "").strip().lower()
-    option = EVIDENCE_OPTIONS.get(choice)
+    choice = (update.message.text or "").strip().lstrip("+")
+    requested_points = EVIDENCE_POINTS.get(choice)
     
-    if not option:
+    if not requested_points:
         await update.message.reply_text(
             "Lua chon khong hop le. Tra loi 1/2/3 hoac +5/+10/+15:"
         )
         return WAITING_FOR_TYPE
     
-    description, requested_points = option
+    description = EVIDENCE_DESCRIPTIONS[requested_points]
     
     # Tạo minh chứng
     evidence = EvidenceService.create_evidence(
@@ -195,32 +195,23 @@ async def notify_admins_new_evidence(
         f"Thoi gian: {evidence.created_at.strftime('%H:%M %d/%m/%Y')}"
     )
     
-    # Gửi cho super admins
-    for admin_id in config.admin.super_admin_ids:
+    # Super admin và admin trong database, đã gộp trùng và được cache
+    admin_ids = UserService.get_admin_ids()
+    reply_markup = Keyboards.approve_reject_evidence(evidence.id)
+    
+    async def _send_to(admin_id: int) -> None:
         try:
             # Gửi ảnh kèm caption
             await context.bot.send_photo(
                 chat_id=admin_id,
                 photo=photo_file_id,
                 caption=message_text,
-                reply_markup=Keyboards.approve_reject_evidence(evidence.id)
+                reply_markup=reply_markup
             )
         except Exception as e:
             logger.error(f"Failed to notify admin {admin_id}: {e}")
     
-    # Gửi cho admin users trong database
-    admins = UserService.get_admin_users()
-    for admin in admins:
-        if admin.user_id not in config.admin.super_admin_ids:
-            try:
-                await context.bot.send_photo(
-                    chat_id=admin.user_id,
-                    photo=photo_file_id,
-                    caption=message_text,
-                    reply_markup=Keyboards.approve_reject_evidence(evidence.id)
-                )
-            except Exception as e:
-                logger.error(f"Failed to notify admin {admin.user_id}: {e}")
+    await asyncio.gather(*(_send_to(admin_id) for admin_id in admin_ids))
 
 
 async def cancel_evidence(
@@ -241,7 +232,7 @@ evidence_conversation = ConversationHandler(
     entry_points=[
         CommandHandler("minhchung", minhchung_command),
         MessageHandler(
-            filters.Regex(f"^{KeyboardLabels.MINHCHUNG}$"),
+            _MINHCHUNG_FILTER,
             minhchung_command
         ),
     ],
@@ -261,7 +252,7 @@ evidence_conversation = ConversationHandler(
     },
     fallbacks=[
         MessageHandler(
-            filters.Regex(f"^{KeyboardLabels.CANCEL}$"),
+            _CANCEL_FILTER,
             cancel_evidence
         ),
         CommandHandler("cancel", cancel_evidence),
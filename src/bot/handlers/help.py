@@ -3,13 +3,15 @@ Help command handler for all users.
 """
 
 from datetime import datetime, timedelta
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Update
 from telegram.ext import ContextTypes
 from telegram.error import BadRequest
 
 from src.services.user_service import UserService
 from src.database import UserRole
 from src.config import config
+from src.constants import CallbackData
+from src.bot.keyboards import Keyboards
 
 
 # Store muted users: {user_id: unmute_timestamp}
@@ -18,6 +20,12 @@ muted_users = {}
 # Mute duration in minutes
 MUTE_DURATION = 30
 
+# Callback data of /ngocminh keyboards sent before the "ngocminh:<choice>" format
+LEGACY_NGOCMINH_CALLBACKS = {
+    "ngocminh_love": "love",
+    "ngocminh_hate": "hate",
+}
+
 
 def is_user_muted(user_id: int) -> bool:
     """Check if user is currently muted."""
@@ -149,14 +157,7 @@ async def ngocminh_command(
 🤔 Bro nghĩ sao về Matcha Queen?
 """
     
-    keyboard = InlineKeyboardMarkup([
-        [
-            InlineKeyboardButton("💚 Yêu Ngọc Minh", callback_data="ngocminh_love"),
-            InlineKeyboardButton("💔 Ghét Ngọc Minh", callback_data="ngocminh_hate"),
-        ]
-    ])
-    
-    await update.message.reply_text(message, reply_markup=keyboard)
+    await update.message.reply_text(message, reply_markup=Keyboards.ngocminh_choice())
 
 
 async def ngocminh_callback_handler(
@@ -168,12 +169,13 @@ async def ngocminh_callback_handler(
     await query.answer()
     
     user_id = query.from_user.id
-    data = query.data
+    _, args = CallbackData.parse(query.data)
+    choice = args[0] if args else LEGACY_NGOCMINH_CALLBACKS.get(query.data)
     
     # Super admin bypass
     is_super = config.admin.is_super_admin(user_id)
     
-    if data == "ngocminh_love":
+    if choice == "love":
         if is_super:
             response = (
                 "💚🍵 MATCHA QUEEN 🍵💚\n\n"
@@ -193,7 +195,7 @@ async def ngocminh_callback_handler(
                 "🍵 Matcha Queen chỉ thuộc về chocomica! 💚"
             )
     
-    elif data == "ngocminh_hate":
+    elif choice == "hate":
         if is_super:
             response = (
                 "💚🍵 MATCHA QUEEN 🍵💚\n\n"
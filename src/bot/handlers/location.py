@@ -19,7 +19,7 @@ from src.services.geolocation import GeolocationService
 from src.database import User
 from src.constants import Messages, CallbackData
 from src.bot.keyboards import Keyboards
-from src.bot.middlewares import require_admin, require_registration, log_action
+from src.bot.middlewares import admin_action
 from src.config import config
 
 logger = logging.getLogger(__name__)
@@ -33,9 +33,7 @@ WAITING_FOR_RADIUS = 3
 location_setup_data = {}
 
 
-@require_registration
-@require_admin
-@log_action("set_location_start")
+@admin_action("set_location_start")
 async def set_location_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
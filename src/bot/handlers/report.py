@@ -5,25 +5,23 @@ Handles daily reports, Excel exports, and statistics.
 """
 
 import logging
-from datetime import datetime, date
 from io import BytesIO
 
 from telegram import Update, InputFile
 from telegram.ext import ContextTypes
 
+from src.services.attendance import AttendanceService
 from src.services.export import ExportService
 from src.services.user_service import UserService
 from src.database import User, get_db_session, AttendanceLog, AttendanceType
 from src.bot.keyboards import Keyboards
-from src.bot.middlewares import require_admin, require_registration, log_action
+from src.bot.middlewares import admin_action
 from sqlalchemy import func
 
 logger = logging.getLogger(__name__)
 
 
-@require_registration
-@require_admin
-@log_action("today_report")
+@admin_action("today_report")
 async def today_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -43,9 +41,7 @@ async def today_command(
     await update.message.reply_text(message)
 
 
-@require_registration
-@require_admin
-@log_action("export_excel")
+@admin_action("export_excel")
 async def export_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -61,7 +57,7 @@ async def export_command(
         /export_excel 3        - March of current year
         /export_excel 3 2024   - March 2024
     """
-    now = datetime.now()
+    now = AttendanceService.get_current_time_naive()
     year = now.year
     month = now.month
     
@@ -118,8 +114,7 @@ async def export_command(
         )
 
 
-@require_registration
-@require_admin
+@admin_action()
 async def export_csv_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -130,7 +125,7 @@ async def export_csv_command(
     
     Generates and sends CSV attendance report.
     """
-    now = datetime.now()
+    now = AttendanceService.get_current_time_naive()
     year = now.year
     month = now.month
     
@@ -164,8 +159,7 @@ async def export_csv_command(
         await update.message.reply_text(f"Loi: {str(e)}")
 
 
-@require_registration
-@require_admin
+@admin_action()
 async def stats_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -176,7 +170,7 @@ async def stats_command(
     
     Shows overall attendance statistics.
     """
-    now = datetime.now()
+    now = AttendanceService.get_current_time_naive()
     
     # Get user stats
     user_stats = UserService.get_user_stats()
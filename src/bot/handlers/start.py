@@ -5,7 +5,6 @@ Handles the /start command and user registration flow.
 """
 
 import logging
-from datetime import datetime
 
 from telegram import Update
 from telegram.ext import (
@@ -16,6 +15,7 @@ from telegram.ext import (
     filters
 )
 
+from src.services.attendance import AttendanceService
 from src.services.user_service import UserService
 from src.database import UserStatus
 from src.constants import Messages, KeyboardLabels
@@ -113,9 +113,8 @@ async def receive_name(
     
     if not is_new:
         # Shouldn't happen, but handle gracefully
-        user_status = user.status.value if hasattr(user.status, 'value') else str(user.status)
         await update.message.reply_text(
-            Messages.ALREADY_REGISTERED.format(status=user_status)
+            Messages.ALREADY_REGISTERED.format(status=user.status_value)
         )
         return ConversationHandler.END
     
@@ -173,7 +172,7 @@ async def notify_admins_new_user(
     message = Messages.NEW_USER_REQUEST.format(
         user_id=user_id,
         name=full_name,
-        time=datetime.now().strftime("%H:%M %d/%m/%Y")
+        time=AttendanceService.get_current_time_naive().strftime("%H:%M %d/%m/%Y")
     )
     
     keyboard = Keyboards.approve_reject_user(user_id)
@@ -1,5 +1,8 @@
 """Keyboard utilities for Telegram Attendance Bot."""
 
+import functools
+from typing import List, Optional, Tuple
+
 from telegram import (
     InlineKeyboardButton,
     InlineKeyboardMarkup,
@@ -12,9 +15,15 @@ from src.constants import CallbackData, KeyboardLabels
 
 
 class Keyboards:
-    """Keyboard factory for creating bot keyboards."""
+    """
+    Keyboard factory for creating bot keyboards.
+    
+    Markups are immutable, so the fixed-layout keyboards are built once
+    and the same instance is returned on every call.
+    """
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def main_menu() -> ReplyKeyboardMarkup:
         """Create main menu keyboard."""
         keyboard = [
@@ -34,6 +43,7 @@ class Keyboards:
         )
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def admin_menu() -> ReplyKeyboardMarkup:
         """Create admin menu keyboard."""
         keyboard = [
@@ -65,6 +75,7 @@ class Keyboards:
         )
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def cancel_only() -> ReplyKeyboardMarkup:
         """Create keyboard with cancel button only."""
         keyboard = [[KeyboardButton(KeyboardLabels.CANCEL)]]
@@ -75,8 +86,13 @@ class Keyboards:
         )
     
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def approve_reject_user(user_id: int) -> InlineKeyboardMarkup:
-        """Create inline keyboard with approve/reject buttons for a user."""
+        """
+        Create inline keyboard with approve/reject buttons for a user.
+        
+        Cached per user: markups are immutable, so one instance can be reused.
+        """
         keyboard = [
             [
                 InlineKeyboardButton(
@@ -91,6 +107,29 @@ class Keyboards:
         ]
         return InlineKeyboardMarkup(keyboard)
     
+    @staticmethod
+    def approve_reject_users(entries: List[Tuple[int, int]]) -> InlineKeyboardMarkup:
+        """
+        Create inline keyboard with one approve/reject row per user.
+        
+        Args:
+            entries: (list number, user_id) pairs, in display order
+        """
+        keyboard = [
+            [
+                InlineKeyboardButton(
+                    f"{KeyboardLabels.APPROVE} #{number}",
+                    callback_data=CallbackData.make(CallbackData.APPROVE_USER, user_id),
+                ),
+                InlineKeyboardButton(
+                    f"{KeyboardLabels.REJECT} #{number}",
+                    callback_data=CallbackData.make(CallbackData.REJECT_USER, user_id),
+                ),
+            ]
+            for number, user_id in entries
+        ]
+        return InlineKeyboardMarkup(keyboard)
+    
     @staticmethod
     def approve_reject_evidence(evidence_id: int) -> InlineKeyboardMarkup:
         """Create inline keyboard with approve/reject buttons for evidence."""
@@ -122,6 +161,33 @@ class Keyboards:
         return InlineKeyboardMarkup(keyboard)
     
     @staticmethod
+    def pagination(prefix: str, page: int, has_next: bool) -> Optional[InlineKeyboardMarkup]:
+        """
+        Create prev/next inline buttons for a paginated list.
+        
+        Args:
+            prefix: Callback data prefix; the target page is appended
+            page: Current page number (1-based)
+            has_next: Whether a following page exists
+            
+        Returns:
+            The keyboard, or None when there is only one page
+        """
+        row = []
+        if page > 1:
+            row.append(InlineKeyboardButton(
+                KeyboardLabels.PREV_PAGE,
+                callback_data=CallbackData.make(prefix, page - 1),
+            ))
+        if has_next:
+            row.append(InlineKeyboardButton(
+                KeyboardLabels.NEXT_PAGE,
+                callback_data=CallbackData.make(prefix, page + 1),
+            ))
+        return InlineKeyboardMarkup([row]) if row else None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
     def confirm_cancel() -> InlineKeyboardMarkup:
         """Create inline keyboard with confirm/cancel buttons."""
         keyboard = [
@@ -139,6 +205,25 @@ class Keyboards:
         return InlineKeyboardMarkup(keyboard)
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def ngocminh_choice() -> InlineKeyboardMarkup:
+        """Create the love/hate buttons for /ngocminh."""
+        keyboard = [
+            [
+                InlineKeyboardButton(
+                    "💚 Yêu Ngọc Minh",
+                    callback_data=CallbackData.make(CallbackData.NGOCMINH, "love"),
+                ),
+                InlineKeyboardButton(
+                    "💔 Ghét Ngọc Minh",
+                    callback_data=CallbackData.make(CallbackData.NGOCMINH, "hate"),
+                ),
+            ],
+        ]
+        return InlineKeyboardMarkup(keyboard)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
     def request_location() -> ReplyKeyboardMarkup:
         """Create keyboard with location request button."""
         keyboard = [
@@ -152,6 +237,7 @@ class Keyboards:
         )
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def remove() -> ReplyKeyboardRemove:
         """Remove the current reply keyboard."""
         return ReplyKeyboardRemove()
@@ -6,6 +6,7 @@ Provides authentication, authorization, and logging decorators.
 
 from __future__ import annotations
 
+import asyncio
 import functools
 import logging
 from typing import Any, Callable, Coroutine, Optional, TypeVar, Union
@@ -15,6 +16,7 @@ from telegram.ext import ContextTypes
 
 from src.config import get_config
 from src.database import User, UserRole, UserStatus, get_db_session
+from src.services.user_service import UserService
 
 logger = logging.getLogger(__name__)
 
@@ -250,9 +252,116 @@ def log_action(action_name: str) -> Callable[[F], F]:
     return decorator
 
 
+def admin_action(action_name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorator factory combining registration, admin and logging checks.
+    
+    Equivalent to stacking @require_registration, @require_admin and
+    (when action_name is given) @log_action, but resolves the user once
+    through the cached UserService lookup and runs a single wrapper.
+    
+    Args:
+        action_name: The name of the action to log, or None to skip logging.
+        
+    Returns:
+        A decorator function.
+        
+    Example:
+        @admin_action("ban_user")
+        async def ban_handler(update: Update, context: ContextTypes.DEFAULT_TYPE, user: User):
+            await update.message.reply_text("User banned!")
+    """
+    def decorator(handler: F) -> F:
+        @functools.wraps(handler)
+        async def wrapper(
+            update: Update,
+            context: ContextTypes.DEFAULT_TYPE,
+            *args: Any,
+            **kwargs: Any,
+        ) -> Any:
+            if not update.effective_user:
+                logger.warning("Update has no effective_user")
+                return None
+            
+            user_id = update.effective_user.id
+            user = UserService.get_user(user_id)
+            
+            if user is None:
+                message = "You are not registered. Please use /start to register."
+                if update.message:
+                    await update.message.reply_text(message)
+                elif update.callback_query:
+                    await update.callback_query.answer(message, show_alert=True)
+                return None
+            
+            if user.role != UserRole.ADMIN and not get_config().admin.is_super_admin(user_id):
+                message = "You don't have permission to use this command."
+                if update.message:
+                    await update.message.reply_text(message)
+                elif update.callback_query:
+                    await update.callback_query.answer(message, show_alert=True)
+                logger.warning(
+                    f"Unauthorized admin access attempt by user {user_id} ({user.full_name})"
+                )
+                return None
+            
+            kwargs["user"] = user
+            if action_name is None:
+                return await handler(update, context, *args, **kwargs)
+            
+            logger.info(f"Action '{action_name}' started by user {user_id} ({user.full_name})")
+            try:
+                result = await handler(update, context, *args, **kwargs)
+            except Exception as e:
+                logger.error(
+                    f"Action '{action_name}' failed for user {user_id}: {e}",
+                    exc_info=True,
+                )
+                raise
+            logger.info(f"Action '{action_name}' completed successfully for user {user_id}")
+            return result
+        
+        return wrapper  # type: ignore[return-value]
+    
+    return decorator
+
+
+def concurrency_limit(max_concurrent: int) -> Callable[[F], F]:
+    """
+    Decorator factory capping how many calls of a handler run at once.
+    
+    With concurrent update processing enabled, this keeps heavy handlers
+    (exports, broadcasts) from piling up; extra calls wait their turn.
+    
+    Args:
+        max_concurrent: Maximum number of simultaneous executions.
+        
+    Returns:
+        A decorator function.
+        
+    Example:
+        @concurrency_limit(2)
+        async def export_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
+            ...
+    """
+    def decorator(handler: F) -> F:
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        @functools.wraps(handler)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            async with semaphore:
+                return await handler(*args, **kwargs)
+        
+        return wrapper  # type: ignore[return-value]
+    
+    return decorator
+
+
 __all__ = [
     "require_registration",
     "require_active",
     "require_admin",
     "log_action",
+    "admin_action",
+    "concurrency_limit",
 ]
@@ -33,10 +33,30 @@ class BotConfig:
     """Telegram bot configuration."""
     
     token: str = field(default_factory=lambda: os.getenv("TELEGRAM_BOT_TOKEN", ""))
+    mode: str = field(default_factory=lambda: os.getenv("BOT_MODE", "polling").lower())
+    webhook_url: str = field(default_factory=lambda: os.getenv("WEBHOOK_URL", ""))
+    webhook_listen: str = field(default_factory=lambda: os.getenv("WEBHOOK_LISTEN", "0.0.0.0"))
+    webhook_port: int = field(default_factory=lambda: int(os.getenv("WEBHOOK_PORT", "8443")))
+    webhook_secret: Optional[str] = field(default_factory=lambda: os.getenv("WEBHOOK_SECRET") or None)
+    persistence_file: Optional[str] = field(default_factory=lambda: os.getenv("BOT_PERSISTENCE_FILE") or None)
     
     def __post_init__(self) -> None:
         if not self.token:
             raise ValueError("TELEGRAM_BOT_TOKEN is required")
+        if self.mode not in ("polling", "webhook"):
+            raise ValueError("BOT_MODE must be 'polling' or 'webhook'")
+        if self.mode == "webhook" and not self.webhook_url:
+            raise ValueError("WEBHOOK_URL is required when BOT_MODE=webhook")
+    
+    @property
+    def use_persistence(self) -> bool:
+        """Whether conversation state and user_data are persisted to disk."""
+        return self.persistence_file is not None
+    
+    @property
+    def use_webhook(self) -> bool:
+        """Whether updates are received via webhook instead of polling."""
+        return self.mode == "webhook"
 
 
 @dataclass
@@ -82,9 +102,13 @@ class AdminConfig:
         default_factory=lambda: _parse_int_list(os.getenv("ADMIN_USER_IDS", ""))
     )
     
+    def __post_init__(self) -> None:
+        # Set lookup for the per-update admin checks
+        self._super_admin_set = frozenset(self.super_admin_ids)
+    
     def is_super_admin(self, user_id: int) -> bool:
         """Check if user is a super admin."""
-        return user_id in self.super_admin_ids
+        return user_id in self._super_admin_set
 
 
 @dataclass
@@ -96,7 +120,8 @@ class TimezoneConfig:
     def __post_init__(self) -> None:
         import pytz
         try:
-            pytz.timezone(self.timezone)
+            # Resolved once; read on every check-in and report
+            self.tzinfo = pytz.timezone(self.timezone)
         except pytz.UnknownTimeZoneError:
             raise ValueError(f"Unknown timezone: {self.timezone}")
 
@@ -38,6 +38,8 @@ class CallbackData:
     REJECT_EVIDENCE = "reject_evidence"
     REGISTER_MEETING = "register_meeting"
     CANCEL = "cancel"
+    NGOCMINH = "ngocminh"
+    LIST_MEETINGS_PAGE = "list_meetings_page"
     
     @staticmethod
     def make(prefix: str, *args) -> str:
@@ -85,6 +87,13 @@ class Messages:
         "Dia diem: {location}\n\n"
         "Nho checkout de nhan diem nha!"
     )
+    CHECKIN_TOO_FAR = (
+        "Ban dang o qua xa dia diem hop!\n\n"
+        "{label}: {name}\n"
+        "Khoang cach: {distance:.0f}m\n"
+        "Ban kinh cho phep: {radius:.0f}m\n\n"
+        "Vui long di den dung dia diem va thu lai."
+    )
     CHECKIN_ALREADY = "Bro oi diem danh roi ma con diem chi?\n\nDa check luc: {time}"
     CHECKOUT_SUCCESS = (
         "NICE! Check-out thanh cong!\n\n"
@@ -132,6 +141,8 @@ class Messages:
     
     # Admin
     ADMIN_ONLY = "Lenh nay chi danh cho Admin!\n\nBro khong du power dau! No cap!"
+    ADMIN_USER_NOT_FOUND = "Khong tim thay user ID: {user_id}"
+    ADMIN_LOCATION_NOT_FOUND = "Khong tim thay dia diem ID: {location_id}"
     
     # Meeting
     MEETING_CREATED = (
@@ -209,6 +220,8 @@ class KeyboardLabels:
     # Admin
     APPROVE = "Duyet"
     REJECT = "Tu choi"
+    PREV_PAGE = "<< Truoc"
+    NEXT_PAGE = "Sau >>"
     LIST_USERS = "Thanh vien"
     LIST_PENDING = "Cho duyet"
     TODAY_REPORT = "Hom nay"
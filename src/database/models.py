@@ -17,8 +17,10 @@ from sqlalchemy import (
     Text,
     text,
     create_engine,
+    event,
     func,
 )
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -119,6 +121,12 @@ class User(Base):
         "MeetingRegistration", back_populates="user", lazy="dynamic"
     )
 
+    @property
+    def status_value(self) -> str:
+        """Status as a plain string, whether loaded from the DB or set as an enum."""
+        status = self.status
+        return status.value if isinstance(status, UserStatus) else status
+
     def __repr__(self) -> str:
         return f"<User(user_id={self.user_id}, full_name='{self.full_name}', role={self.role})>"
 
@@ -193,6 +201,8 @@ class Meeting(Base):
         Index("ix_meetings_meeting_time", "meeting_time"),
         Index("ix_meetings_is_active", "is_active"),
         Index("ix_meetings_location_id", "location_id"),
+        # Active-meeting lookup: range scan on start time among active rows
+        Index("ix_meetings_active_time", "is_active", "meeting_time"),
     )
 
     def __repr__(self) -> str:
@@ -332,9 +342,39 @@ class Evidence(Base):
         return f"<Evidence(id={self.id}, user_id={self.user_id}, status={self.status})>"
 
 
+# Applied to every new SQLite connection. WAL lets readers (/list_users,
+# /ranking, ...) proceed while another handler writes.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 def init_db(database_url: str) -> sessionmaker:
     """Initialize the database and create all tables."""
-    engine = create_engine(database_url, echo=False)
+    if make_url(database_url).get_backend_name() == "sqlite":
+        # Pooled connections are shared between the event loop and the export threads
+        engine = create_engine(
+            database_url,
+            echo=False,
+            connect_args={"check_same_thread": False},
+        )
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+    else:
+        engine = create_engine(database_url, echo=False)
     Base.metadata.create_all(bind=engine)
     _run_schema_migrations(engine)
     return sessionmaker(bind=engine, autocommit=False, autoflush=False)
@@ -379,5 +419,11 @@ def _run_schema_migrations(engine) -> None:
         if "duration_minutes" not in att_cols:
             conn.execute(text("ALTER TABLE attendance_logs ADD COLUMN duration_minutes FLOAT"))
         
+        # Indexes added after the table existed
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_meetings_active_time "
+            "ON meetings (is_active, meeting_time)"
+        ))
+        
         if statements:
             logger.info("Applied meeting schema migrations: %s", ", ".join(statements))
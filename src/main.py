@@ -19,7 +19,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.bot import create_application
+from src.bot import create_application, run
 from src.config import config
 
 
@@ -60,7 +60,8 @@ def main() -> None:
     """
     Main function to run the bot.
     
-    Creates the application and starts polling for updates.
+    Creates the application and starts receiving updates
+    (polling or webhook, depending on BOT_MODE).
     """
     # Setup logging
     setup_logging()
@@ -71,12 +72,9 @@ def main() -> None:
         logger.info("Creating bot application...")
         app = create_application()
         
-        # Run the bot with polling
-        logger.info("Bot is running. Press Ctrl+C to stop.")
-        app.run_polling(
-            allowed_updates=["message", "callback_query"],
-            drop_pending_updates=True  # Ignore updates while bot was offline
-        )
+        # Run the bot (updates received while offline are dropped)
+        logger.info(f"Bot is running ({config.bot.mode}). Press Ctrl+C to stop.")
+        run(app)
         
     except KeyboardInterrupt:
         logger.info("Bot stopped by user (Ctrl+C).")
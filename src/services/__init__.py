@@ -4,20 +4,22 @@ Services package.
 Exports all service classes for use throughout the application.
 """
 
-from .user_service import UserService
+from .user_service import UserService, UserRow
 from .geolocation import GeolocationService
-from .anti_cheat import AntiCheatService, ValidationResult
+from .anti_cheat import AntiCheatService, LocationCheckResult, ValidationResult
 from .attendance import AttendanceService, CheckInResult, CheckOutResult
 from .export import ExportService, DailyReportData
 
 __all__ = [
     # User service
     "UserService",
+    "UserRow",
     # Geolocation service
     "GeolocationService",
     # Anti-cheat service
     "AntiCheatService",
     "ValidationResult",
+    "LocationCheckResult",
     # Attendance service
     "AttendanceService",
     "CheckInResult",
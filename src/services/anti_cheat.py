@@ -16,6 +16,7 @@ import pytz
 from telegram import Message
 
 from src.config import get_config
+from src.services.meeting_service import MeetingService
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,25 @@ class ValidationResult:
     details: Optional[Dict] = field(default=None)
 
 
+@dataclass
+class LocationCheckResult(ValidationResult):
+    """
+    Result of validating a location message against a meeting geofence.
+    
+    distance_meters and radius_meters are None when the message failed
+    anti-cheat or the meeting has no GPS coordinates.
+    """
+    
+    distance_meters: Optional[float] = None
+    radius_meters: Optional[float] = None
+    within_radius: bool = False
+    
+    @property
+    def has_geofence(self) -> bool:
+        """Whether the location was checked against the meeting's coordinates."""
+        return self.distance_meters is not None
+
+
 class AntiCheatService:
     """Service for detecting and preventing attendance fraud."""
     
@@ -39,8 +59,7 @@ class AntiCheatService:
     @staticmethod
     def get_timezone() -> pytz.BaseTzInfo:
         """Get the configured timezone."""
-        config = get_config()
-        return pytz.timezone(config.timezone.timezone)
+        return get_config().timezone.tzinfo
     
     @staticmethod
     def validate_location_message(message: Message) -> ValidationResult:
@@ -69,6 +88,45 @@ class AntiCheatService:
         
         return ValidationResult(is_valid=True)
     
+    @staticmethod
+    def validate_and_locate(message: Message, meeting: Dict) -> LocationCheckResult:
+        """
+        Run anti-cheat checks, then measure the location against the meeting.
+        
+        Args:
+            message: Message carrying the user's location
+            meeting: Meeting snapshot with latitude, longitude and radius keys
+        
+        Returns:
+            The first anti-cheat failure, or a valid result carrying the
+            distance to the meeting when it has GPS coordinates.
+        """
+        result = AntiCheatService.validate_location_message(message)
+        if not result.is_valid:
+            return LocationCheckResult(
+                is_valid=False,
+                error_message=result.error_message,
+                error_code=result.error_code,
+                details=result.details,
+            )
+        
+        center_lat = meeting['latitude']
+        center_lon = meeting['longitude']
+        if center_lat is None or center_lon is None:
+            return LocationCheckResult(is_valid=True)
+        
+        location = message.location
+        radius = meeting['radius'] if meeting['radius'] else 50.0
+        within, distance = MeetingService.is_within_meeting_radius(
+            location.latitude, location.longitude, center_lat, center_lon, radius
+        )
+        return LocationCheckResult(
+            is_valid=True,
+            distance_meters=distance,
+            radius_meters=radius,
+            within_radius=within,
+        )
+    
     @staticmethod
     def check_forwarded_message(message: Message) -> ValidationResult:
         """
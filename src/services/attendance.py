@@ -16,8 +16,18 @@ from src.database import (
     UserStatus,
     get_db_session,
 )
+from src.services.cache import TTLCache
 from src.services.point_service import PointService
 
+# Check-ins are never undone, so a found log can be remembered for the
+# length of a meeting; repeat taps on "Diem danh" then skip the DB
+CHECKIN_LOG_CACHE_TTL_SECONDS = 6 * 60 * 60
+CHECKIN_LOG_CACHE_MAXSIZE = 4096
+
+_checkin_log_cache: TTLCache[AttendanceLog] = TTLCache(
+    maxsize=CHECKIN_LOG_CACHE_MAXSIZE, ttl=CHECKIN_LOG_CACHE_TTL_SECONDS
+)
+
 
 @dataclass
 class CheckInResult:
@@ -44,8 +54,7 @@ class AttendanceService:
     @staticmethod
     def get_timezone() -> pytz.BaseTzInfo:
         """Get the configured timezone."""
-        config = get_config()
-        return pytz.timezone(config.timezone.timezone)
+        return get_config().timezone.tzinfo
 
     @staticmethod
     def get_current_time() -> datetime:
@@ -53,9 +62,20 @@ class AttendanceService:
         tz = AttendanceService.get_timezone()
         return datetime.now(tz)
 
+    @staticmethod
+    def get_current_time_naive() -> datetime:
+        """Get the current wall-clock time in the configured timezone, without tzinfo.
+
+        Meeting times are stored naive in local time, so compare against this.
+        """
+        return AttendanceService.get_current_time().replace(tzinfo=None)
+
     @staticmethod
     def has_checked_in(user_id: int, meeting_id: int) -> bool:
         """Check if user has checked in for a meeting."""
+        if _checkin_log_cache.get((user_id, meeting_id)) is not None:
+            return True
+        
         with get_db_session() as session:
             log = session.query(AttendanceLog).filter(
                 AttendanceLog.user_id == user_id,
@@ -78,6 +98,11 @@ class AttendanceService:
     @staticmethod
     def get_checkin_log(user_id: int, meeting_id: int) -> Optional[AttendanceLog]:
         """Get check-in log for a user and meeting."""
+        key = (user_id, meeting_id)
+        cached = _checkin_log_cache.get(key)
+        if cached is not None:
+            return cached
+        
         with get_db_session() as session:
             log = session.query(AttendanceLog).filter(
                 AttendanceLog.user_id == user_id,
@@ -86,6 +111,7 @@ class AttendanceService:
             ).first()
             if log:
                 session.expunge(log)
+                _checkin_log_cache.set(key, log)
             return log
 
     @staticmethod
@@ -134,6 +160,8 @@ class AttendanceService:
             session.expunge(attendance_log)
             session.expunge(meeting)
 
+        _checkin_log_cache.set((user_id, meeting_id), attendance_log)
+
         return CheckInResult(
             success=True,
             message="Điểm danh thành công!",
@@ -151,30 +179,40 @@ class AttendanceService:
             user_id: The Telegram user ID
             meeting_id: The meeting ID
         """
-        # Check if checked in
-        if not AttendanceService.has_checked_in(user_id, meeting_id):
-            return CheckOutResult(
-                success=False,
-                message="Bạn chưa điểm danh buổi họp này!",
-                attendance_log=None,
-                meeting=None,
-                points_earned=0,
-            )
-
-        # Check if already checked out
-        if AttendanceService.has_checked_out(user_id, meeting_id):
-            return CheckOutResult(
-                success=False,
-                message="Bạn đã check-out rồi!",
-                attendance_log=None,
-                meeting=None,
-                points_earned=0,
-            )
-
         current_time = AttendanceService.get_current_time()
         current_naive = current_time.replace(tzinfo=None)
 
         with get_db_session() as session:
+            # Check-in and check-out logs of this meeting in one query
+            logs = session.query(AttendanceLog).filter(
+                AttendanceLog.user_id == user_id,
+                AttendanceLog.meeting_id == meeting_id,
+                AttendanceLog.type.in_((AttendanceType.IN, AttendanceType.OUT)),
+            ).order_by(AttendanceLog.timestamp.asc()).all()
+            checkin_log = next(
+                (log for log in logs if log.type == AttendanceType.IN), None
+            )
+
+            # Check if checked in
+            if checkin_log is None:
+                return CheckOutResult(
+                    success=False,
+                    message="Bạn chưa điểm danh buổi họp này!",
+                    attendance_log=None,
+                    meeting=None,
+                    points_earned=0,
+                )
+
+            # Check if already checked out
+            if any(log.type == AttendanceType.OUT for log in logs):
+                return CheckOutResult(
+                    success=False,
+                    message="Bạn đã check-out rồi!",
+                    attendance_log=None,
+                    meeting=None,
+                    points_earned=0,
+                )
+
             # Get meeting info
             meeting = session.query(Meeting).filter(
                 Meeting.id == meeting_id
@@ -199,22 +237,6 @@ class AttendanceService:
                     points_earned=0,
                 )
 
-            # Check duration from checkin
-            checkin_log = session.query(AttendanceLog).filter(
-                AttendanceLog.user_id == user_id,
-                AttendanceLog.meeting_id == meeting_id,
-                AttendanceLog.type == AttendanceType.IN,
-            ).order_by(AttendanceLog.timestamp.asc()).first()
-            
-            if not checkin_log:
-                return CheckOutResult(
-                    success=False,
-                    message="Chua co log check-in!",
-                    attendance_log=None,
-                    meeting=meeting,
-                    points_earned=0,
-                )
-            
             duration = current_naive - checkin_log.timestamp
             if duration.total_seconds() < 30 * 60:
                 minutes_left = int((30 * 60 - duration.total_seconds()) // 60) + 1
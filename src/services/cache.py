@@ -0,0 +1,62 @@
+"""
+In-process caching helpers for Telegram Attendance Bot.
+
+Provides a small TTL-bounded LRU cache for hot, rarely changing lookups.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    LRU cache whose entries expire after a fixed time-to-live.
+    
+    Not thread-safe; intended for use from the bot's event loop.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        Args:
+            maxsize: Maximum number of entries kept before evicting the oldest.
+            ttl: Seconds an entry stays valid after being stored.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+    
+    def get(self, key: Hashable, default: Any = None) -> Optional[V]:
+        """Return the cached value for key, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: V) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable, default: Any = None) -> Optional[V]:
+        """Remove key and return its value (expired or not), or default."""
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
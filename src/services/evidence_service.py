@@ -7,6 +7,7 @@ from typing import List, Optional
 from src.database import (
     Evidence,
     EvidenceStatus,
+    User,
     get_db_session,
 )
 from src.services.point_service import PointService
@@ -68,6 +69,36 @@ class EvidenceService:
                 session.expunge(evidence)
             return evidence
 
+    @staticmethod
+    def get_evidence_with_user(evidence_id: int) -> Optional[EvidenceInfo]:
+        """
+        Lấy minh chứng kèm tên người gửi trong một truy vấn (LEFT JOIN users).
+        
+        Nếu user không còn tồn tại, user_name là user_id dạng chuỗi.
+        """
+        with get_db_session() as session:
+            row = (
+                session.query(Evidence, User.full_name)
+                .outerjoin(User, User.user_id == Evidence.user_id)
+                .filter(Evidence.id == evidence_id)
+                .first()
+            )
+            if row is None:
+                return None
+            
+            evidence, full_name = row
+            return EvidenceInfo(
+                id=evidence.id,
+                user_id=evidence.user_id,
+                user_name=full_name or str(evidence.user_id),
+                description=evidence.description,
+                photo_file_id=evidence.photo_file_id,
+                requested_points=evidence.requested_points,
+                status=evidence.status,
+                review_reason=evidence.review_reason,
+                created_at=evidence.created_at,
+            )
+
     @staticmethod
     def get_pending_evidences() -> List[Evidence]:
         """Lấy danh sách minh chứng chờ duyệt."""
@@ -12,10 +12,6 @@ from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
 from typing import Dict, List, Optional, Tuple
 
-import pytz
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-from openpyxl.utils import get_column_letter
 from sqlalchemy import and_, func
 
 from src.config import get_config
@@ -89,18 +85,6 @@ class MonthlyPointRow:
 class ExportService:
     """Service for exporting attendance data to various formats."""
 
-    # Excel styles as class variables
-    HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    HEADER_FONT = Font(color="FFFFFF", bold=True)
-    LATE_FILL = PatternFill(start_color="FF6B6B", end_color="FF6B6B", fill_type="solid")
-    ABSENT_FILL = PatternFill(start_color="FFE66D", end_color="FFE66D", fill_type="solid")
-    THIN_BORDER = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
-    )
-
     @staticmethod
     def get_daily_report(target_date: Optional[date] = None) -> DailyReportData:
         """
@@ -113,7 +97,7 @@ class ExportService:
             DailyReportData containing attendance statistics for the day.
         """
         config = get_config()
-        tz = pytz.timezone(config.timezone.timezone)
+        tz = config.timezone.tzinfo
 
         if target_date is None:
             target_date = datetime.now(tz).date()
@@ -247,7 +231,7 @@ class ExportService:
             Formatted string suitable for Telegram message.
         """
         config = get_config()
-        tz = pytz.timezone(config.timezone.timezone)
+        tz = config.timezone.tzinfo
 
         lines = [
             f"BÁO CÁO CHẤM CÔNG NGÀY {report.date.strftime('%d/%m/%Y')}",
@@ -357,6 +341,15 @@ class ExportService:
         Generate monthly Excel report focusing on points (không tính đi muộn).
         Columns: User, Tổng điểm, Meeting, Evidence, Penalty, Absence, Khác.
         """
+        # openpyxl is heavy to import and only needed here, so load it on first export
+        from openpyxl import Workbook
+        from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+        
+        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+        header_font = Font(color="FFFFFF", bold=True)
+        thin = Side(style="thin")
+        thin_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        
         point_rows = ExportService._get_monthly_points(year, month)
         
         wb = Workbook()
@@ -382,9 +375,9 @@ class ExportService:
         
         for col, header in enumerate(headers, 1):
             cell = ws.cell(row=3, column=col, value=header)
-            cell.fill = ExportService.HEADER_FILL
-            cell.font = ExportService.HEADER_FONT
-            cell.border = ExportService.THIN_BORDER
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.border = thin_border
             cell.alignment = Alignment(horizontal="center")
         
         total_points = total_meeting = total_evidence = 0
@@ -392,14 +385,14 @@ class ExportService:
         
         for idx, row_data in enumerate(point_rows, 1):
             r = idx + 3
-            ws.cell(row=r, column=1, value=idx).border = ExportService.THIN_BORDER
-            ws.cell(row=r, column=2, value=row_data.full_name).border = ExportService.THIN_BORDER
-            ws.cell(row=r, column=3, value=row_data.total_points).border = ExportService.THIN_BORDER
-            ws.cell(row=r, column=4, value=row_data.meeting_points).border = ExportService.THIN_BORDER
-            ws.cell(row=r, column=5, value=row_data.evidence_points).border = ExportService.THIN_BORDER
-            ws.cell(row=r, column=6, value=row_data.penalty_points).border = ExportService.THIN_BORDER
-            ws.cell(row=r, column=7, value=row_data.absence_points).border = ExportService.THIN_BORDER
-            ws.cell(row=r, column=8, value=row_data.other_points).border = ExportService.THIN_BORDER
+            ws.cell(row=r, column=1, value=idx).border = thin_border
+            ws.cell(row=r, column=2, value=row_data.full_name).border = thin_border
+            ws.cell(row=r, column=3, value=row_data.total_points).border = thin_border
+            ws.cell(row=r, column=4, value=row_data.meeting_points).border = thin_border
+            ws.cell(row=r, column=5, value=row_data.evidence_points).border = thin_border
+            ws.cell(row=r, column=6, value=row_data.penalty_points).border = thin_border
+            ws.cell(row=r, column=7, value=row_data.absence_points).border = thin_border
+            ws.cell(row=r, column=8, value=row_data.other_points).border = thin_border
             
             total_points += row_data.total_points
             total_meeting += row_data.meeting_points
@@ -410,13 +403,13 @@ class ExportService:
         
         total_row = len(point_rows) + 4
         ws.cell(row=total_row, column=1, value="Tổng").font = Font(bold=True)
-        ws.cell(row=total_row, column=1).border = ExportService.THIN_BORDER
-        ws.cell(row=total_row, column=3, value=total_points).border = ExportService.THIN_BORDER
-        ws.cell(row=total_row, column=4, value=total_meeting).border = ExportService.THIN_BORDER
-        ws.cell(row=total_row, column=5, value=total_evidence).border = ExportService.THIN_BORDER
-        ws.cell(row=total_row, column=6, value=total_penalty).border = ExportService.THIN_BORDER
-        ws.cell(row=total_row, column=7, value=total_absence).border = ExportService.THIN_BORDER
-        ws.cell(row=total_row, column=8, value=total_other).border = ExportService.THIN_BORDER
+        ws.cell(row=total_row, column=1).border = thin_border
+        ws.cell(row=total_row, column=3, value=total_points).border = thin_border
+        ws.cell(row=total_row, column=4, value=total_meeting).border = thin_border
+        ws.cell(row=total_row, column=5, value=total_evidence).border = thin_border
+        ws.cell(row=total_row, column=6, value=total_penalty).border = thin_border
+        ws.cell(row=total_row, column=7, value=total_absence).border = thin_border
+        ws.cell(row=total_row, column=8, value=total_other).border = thin_border
         
         # Widths
         ws.column_dimensions["A"].width = 6
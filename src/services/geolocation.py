@@ -20,6 +20,63 @@ logger = logging.getLogger(__name__)
 # Earth's radius in meters
 EARTH_RADIUS_METERS = 6_371_000
 
+# Active locations rarely change; cached until the next create/update/delete
+_active_locations_cache: Optional[List[Location]] = None
+
+# Active locations with (lat_rad, lon_rad, cos(lat)) precomputed for nearest-location sweeps
+_active_location_points: Optional[List[Tuple[Location, float, float, float]]] = None
+
+# Largest geofence radius among the cached active locations
+_active_max_radius: float = 0.0
+
+# Bounding-box prefilter: meters per degree of latitude and slack for the box-vs-circle gap
+METERS_PER_DEGREE = 111_320
+BOX_PREFILTER_SLACK = 1.5
+
+
+def _invalidate_active_locations() -> None:
+    """Drop the cached active locations list."""
+    global _active_locations_cache, _active_location_points
+    _active_locations_cache = None
+    _active_location_points = None
+
+
+def _get_active_location_points() -> List[Tuple[Location, float, float, float]]:
+    """Return active locations with their trig terms precomputed."""
+    global _active_location_points, _active_max_radius
+    if _active_location_points is None:
+        points = []
+        for loc in GeolocationService.get_active_locations():
+            lat_rad = math.radians(loc.latitude)
+            points.append((loc, lat_rad, math.radians(loc.longitude), math.cos(lat_rad)))
+        _active_max_radius = max((loc.radius for loc, _, _, _ in points), default=0.0)
+        _active_location_points = points
+    return _active_location_points
+
+
+def _nearest_point(
+    points: List[Tuple[Location, float, float, float]],
+    user_lat_rad: float,
+    user_lon_rad: float,
+    user_cos_lat: float,
+) -> Tuple[Optional[Location], float]:
+    """Return the point with the smallest haversine term, and that term."""
+    # The haversine term grows with distance, so compare it directly and
+    # only turn the winner into meters
+    nearest = None
+    min_a = float("inf")
+
+    for location, lat_rad, lon_rad, cos_lat in points:
+        a = (
+            math.sin((lat_rad - user_lat_rad) / 2) ** 2
+            + user_cos_lat * cos_lat * math.sin((lon_rad - user_lon_rad) / 2) ** 2
+        )
+        if a < min_a:
+            min_a = a
+            nearest = location
+
+    return nearest, min_a
+
 
 @dataclass
 class DistanceResult:
@@ -159,6 +216,7 @@ class GeolocationService:
 
             # Expunge to use outside session
             db.expunge(location)
+            _invalidate_active_locations()
 
             logger.info(
                 f"Created location: {name} at ({latitude}, {longitude}) "
@@ -191,16 +249,24 @@ class GeolocationService:
         """
         Get all active office locations.
 
+        The result is cached in memory until a location is created,
+        updated or deleted through this service.
+
         Returns:
             List of active Location objects
         """
+        global _active_locations_cache
+        if _active_locations_cache is not None:
+            return list(_active_locations_cache)
+
         with get_db_session() as db:
             locations = db.query(Location).filter(Location.is_active == True).all()
 
             for loc in locations:
                 db.expunge(loc)
 
-            return locations
+        _active_locations_cache = locations
+        return list(locations)
 
     @staticmethod
     def get_all_locations() -> List[Location]:
@@ -260,9 +326,19 @@ class GeolocationService:
                 if key in allowed_fields and value is not None:
                     setattr(location, key, value)
 
+            _invalidate_active_locations()
             logger.info(f"Updated location {location_id}: {kwargs}")
             return True
 
+    @staticmethod
+    def invalidate_active_locations() -> None:
+        """
+        Drop the cached active locations.
+
+        Call after deactivating a location outside this service.
+        """
+        _invalidate_active_locations()
+
     @staticmethod
     def delete_location(location_id: int) -> bool:
         """
@@ -299,24 +375,56 @@ class GeolocationService:
             ...     location, distance = nearest
             ...     print(f"Nearest: {location.name} at {distance}m")
         """
-        locations = GeolocationService.get_active_locations()
+        points = _get_active_location_points()
 
-        if not locations:
+        if not points:
             return None
 
+        user_lat_rad = math.radians(user_lat)
+        user_lon_rad = math.radians(user_lon)
+        user_cos_lat = math.cos(user_lat_rad)
+
+        # Points outside a box around the user are farther than the largest
+        # radius, so they skip the trig term; they are only swept if no box
+        # hit lies within that radius (the reject path needs the true nearest)
+        box_lat = math.radians(
+            BOX_PREFILTER_SLACK * _active_max_radius / METERS_PER_DEGREE
+        )
+        box_lon = box_lat / max(user_cos_lat, 0.01)
+        max_radius_a = math.sin(_active_max_radius / (2 * EARTH_RADIUS_METERS)) ** 2
+
         nearest = None
-        min_distance = float("inf")
+        min_a = float("inf")
+        outside = []
+
+        for point in points:
+            location, lat_rad, lon_rad, cos_lat = point
+            if (
+                abs(lat_rad - user_lat_rad) > box_lat
+                or abs(lon_rad - user_lon_rad) > box_lon
+            ):
+                outside.append(point)
+                continue
+            a = (
+                math.sin((lat_rad - user_lat_rad) / 2) ** 2
+                + user_cos_lat * cos_lat * math.sin((lon_rad - user_lon_rad) / 2) ** 2
+            )
+            if a < min_a:
+                min_a = a
+                nearest = location
 
-        for location in locations:
-            distance = GeolocationService.haversine_distance(
-                user_lat, user_lon, location.latitude, location.longitude
+        if min_a > max_radius_a and outside:
+            far, far_a = _nearest_point(
+                outside, user_lat_rad, user_lon_rad, user_cos_lat
             )
+            if far_a < min_a:
+                nearest, min_a = far, far_a
 
-            if distance < min_distance:
-                min_distance = distance
-                nearest = location
+        if nearest is None:
+            return None
 
-        return (nearest, min_distance) if nearest else None
+        distance = 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(min(min_a, 1.0)))
+        return (nearest, distance)
 
     @staticmethod
     def check_location_for_checkin(
@@ -8,6 +8,7 @@ from typing import List, Optional, Tuple
 from sqlalchemy import and_
 
 from src.database import (
+    Location,
     Meeting,
     MeetingType,
     MeetingRegistration,
@@ -16,6 +17,14 @@ from src.database import (
     UserStatus,
     get_db_session,
 )
+from src.services.geolocation import GeolocationService
+
+# Tên hiển thị theo loại meeting
+MEETING_TYPE_DISPLAY = {
+    MeetingType.REGULAR: "📋 Họp thường (C1-101)",
+    MeetingType.SUPPORT: "🎤 Hỗ trợ diễn giả",
+    MeetingType.EVENT: "🎉 Hoạt động ngoại khóa",
+}
 
 
 @dataclass
@@ -36,6 +45,10 @@ class MeetingService:
     # Earth's radius in meters (for haversine calculation)
     EARTH_RADIUS_METERS = 6_371_000
 
+    # Mét trên một độ vĩ (xấp xỉ) và hệ số nới cho bộ lọc hộp bao
+    METERS_PER_DEGREE = 111_320
+    BOX_PREFILTER_SLACK = 1.5
+
     @staticmethod
     def haversine_distance(
         lat1: float,
@@ -106,16 +119,63 @@ class MeetingService:
         if meeting.latitude is None or meeting.longitude is None:
             return (False, 0.0)
 
-        # Calculate distance
-        distance = MeetingService.haversine_distance(
-            user_lat, user_lon, meeting.latitude, meeting.longitude
-        )
-
         # Get radius (default 50m if not set)
         radius = meeting.radius if meeting.radius else 50.0
 
-        is_within = distance <= radius
-        return (is_within, distance)
+        return MeetingService.is_within_meeting_radius(
+            user_lat, user_lon, meeting.latitude, meeting.longitude, radius
+        )
+
+    @staticmethod
+    def is_within_meeting_radius(
+        user_lat: float,
+        user_lon: float,
+        center_lat: float,
+        center_lon: float,
+        radius: float,
+    ) -> Tuple[bool, float]:
+        """
+        Check a location against a geofence, rejecting far points without trig.
+
+        A bounding box of radius * BOX_PREFILTER_SLACK around the center is
+        tested first. Points inside it are decided on the haversine term
+        a <= sin²(radius / 2R), so no inverse trig is needed to accept.
+
+        Returns:
+            Tuple of (is_within_radius, distance_meters). For points rejected
+            by the box, distance is the larger per-axis offset, an approximation
+            that is only accurate at short range.
+        """
+        limit = radius * MeetingService.BOX_PREFILTER_SLACK
+
+        dlat_m = abs(user_lat - center_lat) * MeetingService.METERS_PER_DEGREE
+        if dlat_m > limit:
+            return (False, dlat_m)
+
+        center_lat_rad = math.radians(center_lat)
+        center_cos_lat = math.cos(center_lat_rad)
+
+        dlon_m = (
+            abs(user_lon - center_lon)
+            * MeetingService.METERS_PER_DEGREE
+            * center_cos_lat
+        )
+        if dlon_m > limit:
+            return (False, max(dlat_m, dlon_m))
+
+        user_lat_rad = math.radians(user_lat)
+        a = (
+            math.sin((center_lat_rad - user_lat_rad) / 2) ** 2
+            + math.cos(user_lat_rad) * center_cos_lat
+            * math.sin(math.radians(center_lon - user_lon) / 2) ** 2
+        )
+        diameter = 2 * MeetingService.EARTH_RADIUS_METERS
+        threshold = math.sin(radius / diameter) ** 2
+
+        if a <= threshold:
+            # asin(x) ≈ x at geofence scale (relative error < 1e-6 under 10 km)
+            return (True, diameter * math.sqrt(a))
+        return (False, diameter * math.asin(math.sqrt(min(a, 1.0))))
 
     @staticmethod
     def create_meeting(
@@ -177,9 +237,8 @@ class MeetingService:
             return meeting
 
     @staticmethod
-    def get_active_meeting() -> Optional[Meeting]:
-        """Lấy meeting đang diễn ra (start <= now <= end)."""
-        now = datetime.now()
+    def get_active_meeting(now: datetime) -> Optional[Meeting]:
+        """Lấy meeting đang diễn ra tại thời điểm now (start <= now <= end)."""
         with get_db_session() as session:
             session.query(Meeting).filter(Meeting.is_active == True, Meeting.end_time < now).update({"is_active": False})
             meeting = session.query(Meeting).filter(
@@ -207,18 +266,35 @@ class MeetingService:
             return meetings
 
     @staticmethod
-    def get_upcoming_meetings(days: int = 7) -> List[Meeting]:
-        """Lấy danh sách meeting sắp tới."""
-        now = datetime.now()
+    def get_upcoming_meetings(
+        now: datetime,
+        days: int = 7,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Meeting]:
+        """
+        Lấy danh sách meeting sắp tới, sắp theo giờ bắt đầu.
+        
+        Args:
+            now: Thời điểm hiện tại (giờ địa phương, không tzinfo)
+            days: Số ngày tính từ hiện tại
+            limit: Số meeting tối đa (None = tất cả)
+            offset: Bỏ qua bao nhiêu meeting đầu (dùng cho phân trang)
+        """
         end_date = now + timedelta(days=days)
         
         with get_db_session() as session:
             session.query(Meeting).filter(Meeting.is_active == True, Meeting.end_time < now).update({"is_active": False})
-            meetings = session.query(Meeting).filter(
+            query = session.query(Meeting).filter(
                 Meeting.is_active == True,
                 Meeting.end_time >= now,
                 Meeting.meeting_time <= end_date,
-            ).order_by(Meeting.meeting_time.asc()).all()
+            ).order_by(Meeting.meeting_time.asc(), Meeting.id.asc())
+            if offset:
+                query = query.offset(offset)
+            if limit is not None:
+                query = query.limit(limit)
+            meetings = query.all()
             
             for m in meetings:
                 session.expunge(m)
@@ -255,6 +331,32 @@ class MeetingService:
         """Delete (soft) a meeting by marking inactive."""
         return MeetingService.deactivate_meeting(meeting_id)
 
+    @staticmethod
+    def delete_meeting_with_location(meeting_id: int) -> bool:
+        """
+        Vô hiệu hóa meeting và địa điểm gắn với nó trong cùng một transaction.
+        
+        Args:
+            meeting_id: ID của meeting
+            
+        Returns:
+            True nếu đã xóa, False nếu không tìm thấy meeting
+        """
+        with get_db_session() as session:
+            meeting = session.get(Meeting, meeting_id)
+            if meeting is None:
+                return False
+            meeting.is_active = False
+            location_id = meeting.location_id
+            if location_id:
+                session.query(Location).filter(
+                    Location.id == location_id
+                ).update({Location.is_active: False}, synchronize_session=False)
+        
+        if location_id:
+            GeolocationService.invalidate_active_locations()
+        return True
+
     @staticmethod
     def mark_notified(meeting_id: int) -> bool:
         """Đánh dấu đã gửi thông báo."""
@@ -355,12 +457,7 @@ class MeetingService:
     @staticmethod
     def get_meeting_type_display(meeting_type: MeetingType) -> str:
         """Hiển thị loại meeting."""
-        displays = {
-            MeetingType.REGULAR: "📋 Họp thường (C1-101)",
-            MeetingType.SUPPORT: "🎤 Hỗ trợ diễn giả",
-            MeetingType.EVENT: "🎉 Hoạt động ngoại khóa",
-        }
-        return displays.get(meeting_type, "📋 Họp")
+        return MEETING_TYPE_DISPLAY.get(meeting_type, "📋 Họp")
 
     @staticmethod
     def format_meeting_info(meeting: Meeting) -> str:
@@ -4,8 +4,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import and_, case, func
 
+from src.config import get_config
 from src.database import (
     PointLog,
     User,
@@ -13,12 +14,18 @@ from src.database import (
     WarningLevel,
     get_db_session,
 )
+from src.services.cache import TTLCache
 
 
 # Ngưỡng điểm để nâng cảnh báo
 LOW_POINT_THRESHOLD = 15  # Dưới 15 điểm = cảnh báo
 CONSECUTIVE_LOW_MONTHS = 2  # Số tháng liên tiếp dưới ngưỡng để nâng band cảnh báo
 
+# Cache bảng xếp hạng theo (month, year); bị xoá mỗi khi điểm/cảnh báo hoặc user thay đổi
+RANKINGS_CACHE_TTL_SECONDS = 300
+
+_rankings_cache: TTLCache = TTLCache(maxsize=12, ttl=RANKINGS_CACHE_TTL_SECONDS)
+
 
 @dataclass
 class UserPointSummary:
@@ -37,8 +44,8 @@ class PointService:
 
     @staticmethod
     def get_current_month_year() -> Tuple[int, int]:
-        """Lấy tháng và năm hiện tại."""
-        now = datetime.now()
+        """Lấy tháng và năm hiện tại theo múi giờ cấu hình."""
+        now = datetime.now(get_config().timezone.tzinfo)
         return now.month, now.year
 
     @staticmethod
@@ -74,6 +81,7 @@ class PointService:
             session.add(point_log)
             session.flush()
             session.expunge(point_log)
+            _rankings_cache.clear()
             return point_log
 
     @staticmethod
@@ -176,52 +184,70 @@ class PointService:
             return "🏴‍☠️ Hải Tặc"
 
     @staticmethod
-    def get_all_rankings(month: int = None, year: int = None) -> List[UserPointSummary]:
-        """Lấy bảng xếp hạng tất cả users."""
+    def invalidate_rankings() -> None:
+        """
+        Xoá cache bảng xếp hạng.
+        
+        Gọi khi trạng thái hoặc tên user thay đổi bên ngoài service này.
+        """
+        _rankings_cache.clear()
+    
+    @staticmethod
+    def get_all_rankings(
+        month: int = None,
+        year: int = None,
+        limit: Optional[int] = None,
+    ) -> List[UserPointSummary]:
+        """
+        Lấy bảng xếp hạng tất cả users (hoặc top `limit`).
+        
+        Điểm tháng và điểm kỳ được tính trong một truy vấn gộp; kết quả
+        được cache cho tới khi điểm, cảnh báo hoặc thông tin user thay đổi.
+        """
         if month is None or year is None:
             month, year = PointService.get_current_month_year()
         
+        rankings = _rankings_cache.get((month, year))
+        if rankings is None:
+            rankings = PointService._compute_rankings(month, year)
+            _rankings_cache.set((month, year), rankings)
+        
+        return rankings[:limit] if limit is not None else list(rankings)
+
+    @staticmethod
+    def _compute_rankings(month: int, year: int) -> List[UserPointSummary]:
+        """Helper: tính bảng xếp hạng từ DB, sắp theo điểm tổng kỳ giảm dần."""
+        monthly = func.coalesce(
+            func.sum(case((PointLog.month == month, PointLog.points), else_=0)), 0
+        )
+        total = func.coalesce(func.sum(PointLog.points), 0)
+        
         with get_db_session() as session:
-            # Lấy tất cả user active
-            users = session.query(User).filter(
-                User.status == UserStatus.ACTIVE
-            ).all()
-            
-            rankings = []
-            for user in users:
-                # Điểm tháng
-                monthly = session.query(func.sum(PointLog.points)).filter(
-                    PointLog.user_id == user.user_id,
-                    PointLog.month == month,
-                    PointLog.year == year,
-                ).scalar() or 0
-                
-                # Điểm năm (tổng kỳ)
-                total = session.query(func.sum(PointLog.points)).filter(
-                    PointLog.user_id == user.user_id,
-                    PointLog.year == year,
-                ).scalar() or 0
-                
-                cc_level = PointService.get_cc_level(monthly)
-                
-                rankings.append(UserPointSummary(
-                    user_id=user.user_id,
-                    user_name=user.full_name,
-                    monthly_points=monthly,
-                    total_points=total,
-                    rank=0,  # Sẽ tính sau
-                    warning_level=user.warning_level,
-                    cc_level=cc_level,
-                ))
-            
-            # Sắp xếp theo điểm tổng kỳ giảm dần
-            rankings.sort(key=lambda x: x.total_points, reverse=True)
-            
-            # Gán rank
-            for i, r in enumerate(rankings):
-                r.rank = i + 1
-            
-            return rankings
+            rows = (
+                session.query(User.user_id, User.full_name, User.warning_level, monthly, total)
+                .outerjoin(
+                    PointLog,
+                    and_(PointLog.user_id == User.user_id, PointLog.year == year),
+                )
+                .filter(User.status == UserStatus.ACTIVE)
+                .group_by(User.user_id, User.full_name, User.warning_level)
+                .order_by(total.desc(), User.user_id)
+                .all()
+            )
+        
+        return [
+            UserPointSummary(
+                user_id=user_id,
+                user_name=full_name,
+                monthly_points=monthly_points,
+                total_points=total_points,
+                rank=rank,
+                warning_level=warning_level,
+                cc_level=PointService.get_cc_level(monthly_points),
+            )
+            for rank, (user_id, full_name, warning_level, monthly_points, total_points)
+            in enumerate(rows, 1)
+        ]
 
     @staticmethod
     def get_user_ranking(user_id: int) -> Optional[UserPointSummary]:
@@ -269,6 +295,9 @@ class PointService:
             
             session.commit()
         
+        if updated:
+            _rankings_cache.clear()
+        
         return updated
 
     @staticmethod
@@ -8,13 +8,78 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import case, func
 
 from src.config import get_config
 from src.database import User, UserRole, UserStatus, get_db_session
+from src.services.cache import TTLCache
+from src.services.point_service import PointService
 
 logger = logging.getLogger(__name__)
 
+# Short-lived cache for user lookups; entries are dropped on every write
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAXSIZE = 2048
+
+_user_cache: TTLCache[User] = TTLCache(maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL_SECONDS)
+
+# /stats is read-heavy and tolerates a few seconds of staleness
+USER_STATS_TTL_SECONDS = 10
+
+_stats_cache: TTLCache[Dict[str, int]] = TTLCache(maxsize=1, ttl=USER_STATS_TTL_SECONDS)
+
+# Full user list backing the active/pending listings; dropped on every write
+USER_LIST_TTL_SECONDS = 30
+
+_user_list_cache: TTLCache[List[User]] = TTLCache(maxsize=1, ttl=USER_LIST_TTL_SECONDS)
+
+
+# Admin IDs (config super admins plus DB admins), checked on every admin callback
+ADMIN_IDS_TTL_SECONDS = 300
+
+_admin_ids_cache: TTLCache[FrozenSet[int]] = TTLCache(maxsize=1, ttl=ADMIN_IDS_TTL_SECONDS)
+
+
+def _invalidate_user(user_id: int) -> None:
+    """Drop every cached value that a write to user_id may have changed."""
+    _user_cache.pop(user_id, None)
+    _user_list_cache.clear()
+    _stats_cache.clear()
+    _admin_ids_cache.clear()
+    # Rankings list only active users and show their names
+    PointService.invalidate_rankings()
+
+
+def _admin_id_set() -> FrozenSet[int]:
+    """Return the cached set of admin user IDs, loading it if needed."""
+    cached = _admin_ids_cache.get("admins")
+    if cached is not None:
+        return cached
+    
+    admin_ids = set(get_config().admin.super_admin_ids)
+    with get_db_session() as db:
+        db_admins = db.query(User.user_id).filter(User.role == UserRole.ADMIN).all()
+        admin_ids.update(admin_id for (admin_id,) in db_admins)
+    
+    result = frozenset(admin_ids)
+    _admin_ids_cache.set("admins", result)
+    return result
+
+
+class UserRow(NamedTuple):
+    """
+    Lightweight read-only view of a user for listings.
+    
+    status and role are always enum members (never raw strings).
+    """
+    
+    user_id: int
+    full_name: str
+    status: UserStatus
+    role: UserRole
+
 
 class UserService:
     """Service class for user management operations."""
@@ -30,10 +95,15 @@ class UserService:
         Returns:
             The User object if found, None otherwise.
         """
+        cached = _user_cache.get(user_id)
+        if cached is not None:
+            return cached
+        
         with get_db_session() as db:
             user = db.query(User).filter(User.user_id == user_id).first()
             if user:
                 db.expunge(user)
+                _user_cache.set(user_id, user)
             return user
     
     @staticmethod
@@ -68,6 +138,7 @@ class UserService:
             db.add(user)
             db.flush()
             db.expunge(user)
+            _invalidate_user(user_id)
             logger.info(f"Created user: {user_id} ({full_name}) with role={role}, status={status}")
             return user
     
@@ -96,6 +167,7 @@ class UserService:
                 if existing_user.full_name != full_name:
                     existing_user.full_name = full_name
                     db.flush()
+                    _invalidate_user(user_id)
                 db.expunge(existing_user)
                 return existing_user, False
             
@@ -121,6 +193,7 @@ class UserService:
             db.add(user)
             db.flush()
             db.expunge(user)
+            _invalidate_user(user_id)
             return user, True
     
     @staticmethod
@@ -146,6 +219,7 @@ class UserService:
             user.updated_at = datetime.utcnow()
             db.flush()
             db.expunge(user)
+            _invalidate_user(user_id)
             logger.info(f"User {user_id} approved by {approved_by}")
             return user
     
@@ -169,6 +243,7 @@ class UserService:
                 return False
             
             db.delete(user)
+            _invalidate_user(user_id)
             logger.info(f"User {user_id} rejected and deleted by {rejected_by}")
             return True
     
@@ -195,6 +270,7 @@ class UserService:
             user.updated_at = datetime.utcnow()
             db.flush()
             db.expunge(user)
+            _invalidate_user(user_id)
             logger.info(f"User {user_id} banned by {banned_by}")
             return user
     
@@ -221,6 +297,7 @@ class UserService:
             user.updated_at = datetime.utcnow()
             db.flush()
             db.expunge(user)
+            _invalidate_user(user_id)
             logger.info(f"User {user_id} unbanned by {unbanned_by}")
             return user
     
@@ -246,6 +323,7 @@ class UserService:
             user.updated_at = datetime.utcnow()
             db.flush()
             db.expunge(user)
+            _invalidate_user(user_id)
             logger.info(f"User {user_id} promoted to admin")
             return user
     
@@ -257,11 +335,7 @@ class UserService:
         Returns:
             List of pending User objects.
         """
-        with get_db_session() as db:
-            users = db.query(User).filter(User.status == UserStatus.PENDING).all()
-            for user in users:
-                db.expunge(user)
-            return users
+        return [u for u in UserService.get_all_users() if u.status == UserStatus.PENDING]
     
     @staticmethod
     def get_active_users() -> List[User]:
@@ -271,43 +345,112 @@ class UserService:
         Returns:
             List of active User objects.
         """
-        with get_db_session() as db:
-            users = db.query(User).filter(User.status == UserStatus.ACTIVE).all()
-            for user in users:
-                db.expunge(user)
-            return users
+        return [u for u in UserService.get_all_users() if u.status == UserStatus.ACTIVE]
     
     @staticmethod
     def get_all_users() -> List[User]:
         """
         Get all users.
         
+        The list is cached for a short time and dropped on every user
+        write, so back-to-back admin listings share one query. Loading it
+        also fills the get_user cache.
+        
         Returns:
             List of all User objects.
         """
+        cached = _user_list_cache.get("all")
+        if cached is not None:
+            return list(cached)
+        
         with get_db_session() as db:
             users = db.query(User).all()
             for user in users:
                 db.expunge(user)
-            return users
+        
+        _user_list_cache.set("all", users)
+        # Prime per-user lookups, e.g. approve/reject clicks on a /list_pending page
+        for user in users:
+            _user_cache.set(user.user_id, user)
+        return list(users)
     
     @staticmethod
-    def get_admin_ids() -> List[int]:
+    def get_users_grouped() -> Tuple[List[UserRow], Dict[str, int]]:
         """
-        Get all admin user IDs (from database and config).
+        Get all users ordered by status, together with per-status counts.
+        
+        Users come back ordered active, pending, banned (then by name) so
+        callers can group them in a single pass. Rows are plain tuples
+        rather than ORM objects, so iterating large lists stays cheap.
         
         Returns:
-            List of admin Telegram user IDs.
+            A tuple of (users, counts) where counts maps each status value
+            to its number of users, plus an "admins" entry.
         """
-        config = get_config()
-        admin_ids = set(config.admin.super_admin_ids)
+        status_order = case(
+            {
+                UserStatus.ACTIVE: 0,
+                UserStatus.PENDING: 1,
+                UserStatus.BANNED: 2,
+            },
+            value=User.status,
+            else_=3,
+        )
         
         with get_db_session() as db:
-            db_admins = db.query(User.user_id).filter(User.role == UserRole.ADMIN).all()
-            for (admin_id,) in db_admins:
-                admin_ids.add(admin_id)
+            rows = (
+                db.query(User.user_id, User.full_name, User.status, User.role)
+                .order_by(status_order, User.full_name)
+                .all()
+            )
+            users = [
+                UserRow(user_id, full_name, UserStatus(status), UserRole(role))
+                for user_id, full_name, status, role in rows
+            ]
+            
+            counts: Dict[str, int] = {"admins": 0}
+            count_rows = (
+                db.query(
+                    User.status,
+                    func.count(),
+                    func.count().filter(User.role == UserRole.ADMIN),
+                )
+                .group_by(User.status)
+                .all()
+            )
+            for status, count, admin_count in count_rows:
+                counts[status] = count
+                counts["admins"] += admin_count
+            
+            return users, counts
+    
+    @staticmethod
+    def is_admin(user_id: int) -> bool:
+        """
+        Check whether a user may run admin actions.
+        
+        Super admins from config pass without a lookup; everyone else is
+        checked against the cached admin ID set.
         
-        return list(admin_ids)
+        Args:
+            user_id: The Telegram user ID.
+            
+        Returns:
+            True if the user is a super admin or has the admin role.
+        """
+        if get_config().admin.is_super_admin(user_id):
+            return True
+        return user_id in _admin_id_set()
+    
+    @staticmethod
+    def get_admin_ids() -> List[int]:
+        """
+        Get all admin user IDs (from database and config).
+        
+        Returns:
+            List of admin Telegram user IDs.
+        """
+        return list(_admin_id_set())
     
     @staticmethod
     def get_admin_users() -> List[User]:
@@ -328,25 +471,28 @@ class UserService:
         """
         Get user statistics.
         
+        All counts come from one aggregate query; results are cached
+        for a few seconds.
+        
         Returns:
             Dictionary with user counts by status and role.
         """
+        cached = _stats_cache.get("stats")
+        if cached is not None:
+            return dict(cached)
+        
         with get_db_session() as db:
-            total = db.query(User).count()
-            active = db.query(User).filter(User.status == UserStatus.ACTIVE).count()
-            pending = db.query(User).filter(User.status == UserStatus.PENDING).count()
-            banned = db.query(User).filter(User.status == UserStatus.BANNED).count()
-            admins = db.query(User).filter(User.role == UserRole.ADMIN).count()
-            members = db.query(User).filter(User.role == UserRole.MEMBER).count()
-            
-            return {
-                "total": total,
-                "active": active,
-                "pending": pending,
-                "banned": banned,
-                "admins": admins,
-                "members": members,
-            }
-
+            row = db.query(
+                func.count().label("total"),
+                func.count().filter(User.status == UserStatus.ACTIVE).label("active"),
+                func.count().filter(User.status == UserStatus.PENDING).label("pending"),
+                func.count().filter(User.status == UserStatus.BANNED).label("banned"),
+                func.count().filter(User.role == UserRole.ADMIN).label("admins"),
+                func.count().filter(User.role == UserRole.MEMBER).label("members"),
+            ).select_from(User).one()
+        
+        stats = dict(row._mapping)
+        _stats_cache.set("stats", stats)
+        return dict(stats)
 
-__all__ = ["UserService"]
+__all__ = ["UserService", "UserRow"]